@@ -1,8 +1,8 @@
 """
 GCS Bucket Browser & Downloader
 
-A user-friendly, cross-platform tool to browse Google Cloud Storage buckets 
-like a file tree, select folders/files to download, and sync them to local 
+A user-friendly, cross-platform tool to browse Google Cloud Storage buckets
+like a file tree, select folders/files to download, and sync them to local
 destinations using various methods.
 
 Features:
@@ -19,14 +19,40 @@ __author__ = "Michael Akridge, NOAA"
 __email__ = "michael.akridge@noaa.gov"
 __description__ = "User-friendly Google Cloud Storage bucket browser and downloader"
 
-from .core import GCSBrowser, GCSItem, DownloadJob
-from .utils import detect_download_tools, download_with_gsutil, download_with_gcsfs
+# Exports are resolved lazily (PEP 562) so that `import gcs_browser` stays
+# cheap - core pulls in numpy/gcsfs/google-cloud-storage, which costs
+# hundreds of ms that --help and tab-completion shouldn't pay.
+_CORE_EXPORTS = {"GCSBrowser", "GCSItem", "DownloadJob", "size_human_batch"}
+_UTILS_EXPORTS = {
+    "detect_download_tools",
+    "download_with_gsutil",
+    "download_with_gcsfs",
+    "download_with_gcsfs_async",
+    "download_with_transfer_manager",
+}
 
 __all__ = [
     "GCSBrowser",
-    "GCSItem", 
+    "GCSItem",
     "DownloadJob",
+    "size_human_batch",
     "detect_download_tools",
     "download_with_gsutil",
     "download_with_gcsfs",
+    "download_with_gcsfs_async",
+    "download_with_transfer_manager",
 ]
+
+
+def __getattr__(name):
+    if name in _CORE_EXPORTS:
+        from . import core
+        return getattr(core, name)
+    if name in _UTILS_EXPORTS:
+        from . import utils
+        return getattr(utils, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -3,13 +3,21 @@
 GCS Bucket Browser & Downloader - CLI Interface
 """
 
+import os
 import sys
 import argparse
 import subprocess
 from pathlib import Path
 
-from .core import GCSBrowser, GCSItem
-from .utils import detect_download_tools, download_with_gsutil, download_with_gcsfs, sync_with_rsync
+from .core import GCSBrowser, GCSItem, size_human_batch
+from .server import send_request, list_items_via_server
+from .utils import (
+    detect_download_tools,
+    download_with_gsutil,
+    download_with_gcsfs,
+    download_with_gcsfs_async,
+    sync_with_rsync,
+)
 
 
 class GCSCLIBrowser(GCSBrowser):
@@ -20,7 +28,7 @@ class GCSCLIBrowser(GCSBrowser):
         self.connect(use_anonymous, credentials_path)
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description="GCS Bucket Browser & Downloader - CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -35,7 +43,7 @@ Examples:
         """
     )
     
-    parser.add_argument('command', choices=['list-buckets', 'browse', 'download', 'sync'],
+    parser.add_argument('command', choices=['list-buckets', 'browse', 'download', 'sync', 'serve'],
                        help='Command to execute')
     parser.add_argument('source', nargs='?', help='GCS path (gs://bucket/path/)')
     parser.add_argument('destination', nargs='?', help='Local destination path')
@@ -51,11 +59,26 @@ Examples:
                        help='Verbose output')
     parser.add_argument('--dry-run', action='store_true',
                        help='Show what would be done without doing it')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Bypass the on-disk listing cache')
+    parser.add_argument('--async', action='store_true', dest='use_async',
+                       help='Use async gcsfs downloads (gcsfs method only)')
+    parser.add_argument('--bwlimit', type=int, metavar='KBPS',
+                       help='Bandwidth limit in KB/s (rsync sync only)')
     parser.add_argument('--delete', action='store_true',
                        help='Delete files in destination that don\'t exist in source (sync only)')
     
-    args = parser.parse_args()
-    
+    # argv=None falls through to sys.argv; tests pass arguments
+    # directly instead of forking an interpreter
+    args = parser.parse_args(argv)
+
+    if args.command == 'serve':
+        # Long-running mode: keep one connected browser alive and answer
+        # forwarded commands over a UNIX socket
+        from .server import serve
+        use_anon = args.anonymous or not args.credentials
+        return serve(use_anonymous=use_anon, credentials_path=args.credentials)
+
     # Detect available tools
     tools = detect_download_tools()
     
@@ -75,14 +98,25 @@ Examples:
         print("❌ rsync not available on this platform. Use gsutil or gcsfs instead.")
         return 1
     
-    # Initialize browser
+    # Browser construction is deferred: when a `gcs-browser serve` daemon
+    # is running, list-buckets/browse forward to it and never pay the
+    # connection setup cost here
     use_anon = args.anonymous or not args.credentials
-    browser = GCSCLIBrowser(use_anonymous=use_anon, credentials_path=args.credentials)
-    
+
+    def make_browser():
+        b = GCSCLIBrowser(use_anonymous=use_anon, credentials_path=args.credentials)
+        if args.no_cache:
+            b.cache_enabled = False
+        return b
+
     # Execute command
     if args.command == 'list-buckets':
         print("📋 Available buckets:")
-        buckets = browser.list_buckets()
+        response = send_request({'cmd': 'buckets'})
+        if response and response.get('status') == 'ok':
+            buckets = response.get('buckets', [])
+        else:
+            buckets = make_browser().list_buckets()
         if buckets:
             for bucket in buckets:
                 print(f"  📁 {bucket}")
@@ -106,27 +140,28 @@ Examples:
         bucket = parts[0]
         prefix = parts[1] if len(parts) > 1 else ""
         
-        items = browser.list_items(bucket, prefix)
-        
+        items = None
+        if not args.no_cache:
+            items = list_items_via_server(bucket, prefix)
+        if items is None:
+            items = make_browser().list_items(bucket, prefix)
+
         if not items:
             print("  📭 No items found")
         else:
             print(f"  Found {len(items)} items:\n")
-            
-            # Calculate column widths
-            max_name_len = max(len(item.name) for item in items)
-            max_size_len = max(len(item.size_human) for item in items if item.type == 'file')
-            max_size_len = max(max_size_len, 8) if max_size_len else 8
-            
-            # Header
-            print(f"  {'Type':<6} {'Name':<{max_name_len}} {'Size':<{max_size_len}} {'Modified'}")
-            print(f"  {'-'*6} {'-'*max_name_len} {'-'*max_size_len} {'-'*19}")
-            
-            # Items
-            for item in items:
+
+            # Format all sizes in one vectorized pass, then build rows and
+            # column widths in a single loop instead of re-scanning items
+            size_strs = size_human_batch([item.size for item in items])
+
+            max_name_len = len('Name')
+            max_size_len = 8
+            rows = []
+            for item, size_human in zip(items, size_strs):
                 icon = "📁" if item.type == "folder" else "📄"
-                size_str = item.size_human if item.type == "file" else "-"
-                
+                size_str = size_human if item.type == "file" else "-"
+
                 if item.modified:
                     if hasattr(item.modified, 'strftime'):
                         modified_str = item.modified.strftime('%Y-%m-%d %H:%M')
@@ -134,8 +169,21 @@ Examples:
                         modified_str = str(item.modified)[:19]  # Truncate if string
                 else:
                     modified_str = "-"
-                
-                print(f"  {icon:<6} {item.name:<{max_name_len}} {size_str:<{max_size_len}} {modified_str}")
+
+                rows.append((icon, item.name, size_str, modified_str))
+                if len(item.name) > max_name_len:
+                    max_name_len = len(item.name)
+                if item.type == "file" and len(size_str) > max_size_len:
+                    max_size_len = len(size_str)
+
+            # Assemble the table and emit it with one write
+            lines = [
+                f"  {'Type':<6} {'Name':<{max_name_len}} {'Size':<{max_size_len}} {'Modified'}",
+                f"  {'-'*6} {'-'*max_name_len} {'-'*max_size_len} {'-'*19}",
+            ]
+            for icon, name, size_str, modified_str in rows:
+                lines.append(f"  {icon:<6} {name:<{max_name_len}} {size_str:<{max_size_len}} {modified_str}")
+            sys.stdout.write("\n".join(lines) + "\n")
     
     elif args.command == 'download':
         if not args.source or not args.destination:
@@ -153,8 +201,10 @@ Examples:
                 args.source, args.destination, 
                 recursive=True, parallel=args.parallel
             )
+        elif args.use_async:
+            success = download_with_gcsfs_async(make_browser(), args.source, args.destination)
         else:  # gcsfs
-            success = download_with_gcsfs(browser, args.source, args.destination)
+            success = download_with_gcsfs(make_browser(), args.source, args.destination)
         
         return 0 if success else 1
     
@@ -173,18 +223,39 @@ Examples:
         
         if args.method == 'rsync':
             success = sync_with_rsync(
-                args.source, args.destination, 
-                dry_run=args.dry_run, delete=args.delete, verbose=args.verbose
+                args.source, args.destination,
+                dry_run=args.dry_run, delete=args.delete, verbose=args.verbose,
+                bwlimit=args.bwlimit
             )
+        elif tools.get('gcloud'):
+            # Prefer gcloud storage rsync - consistently parallel, tuned
+            # via CLOUDSDK_STORAGE_* properties (16 threads x 4 processes
+            # saturates typical object-store bandwidth)
+            cmd = ['gcloud', 'storage', 'rsync', '--recursive']
+            if args.delete:
+                cmd.append('--delete-unmatched-destination-objects')
+            cmd.extend([args.source, args.destination])
+
+            env = dict(os.environ,
+                       CLOUDSDK_STORAGE_PROCESS_COUNT='4',
+                       CLOUDSDK_STORAGE_THREAD_COUNT='16')
+
+            print(f"🚀 Running: {' '.join(cmd)}")
+            result = subprocess.run(cmd, capture_output=not args.verbose,
+                                    text=True, env=env)
+            success = result.returncode == 0
         else:
-            # Use gsutil for sync
-            cmd = ['gsutil', '-m', 'rsync', '-r']
+            # Use gsutil for sync with an explicitly widened worker pool
+            cmd = ['gsutil',
+                   '-o', 'GSUtil:parallel_thread_count=16',
+                   '-o', 'GSUtil:parallel_process_count=4',
+                   '-m', 'rsync', '-r']
             if args.delete:
                 cmd.append('-d')
             if args.verbose:
                 cmd.append('-v')
             cmd.extend([args.source, args.destination])
-            
+
             print(f"🚀 Running: {' '.join(cmd)}")
             result = subprocess.run(cmd, capture_output=not args.verbose, text=True)
             success = result.returncode == 0
@@ -6,6 +6,9 @@ import os
 import sys
 import json
 import time
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple, Set
 from dataclasses import dataclass
@@ -23,10 +26,45 @@ try:
 except ImportError:
     HAS_STREAMLIT = False
 
-import pandas as pd
-import gcsfs
-from google.cloud import storage
-from google.api_core import exceptions as gcs_exceptions
+# orjson is an optional performance enhancement (3-5x faster than stdlib
+# json); the disk cache falls back gracefully without it
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+def size_human_batch(sizes) -> List[str]:
+    """Format many byte counts at once using vectorized NumPy math
+
+    Much faster than calling GCSItem.size_human per row when rendering
+    large listings.
+    """
+    import numpy as np
+
+    arr = np.asarray(list(sizes), dtype=np.int64)
+    idx = np.zeros(arr.shape, dtype=np.int64)
+    positive = arr > 0
+    if positive.any():
+        idx[positive] = np.clip(
+            (np.log2(arr[positive]) / 10).astype(np.int64),
+            0, len(_SIZE_UNITS) - 1
+        )
+    scaled = arr / np.power(2.0, 10 * idx)
+    return [
+        f"{s:.1f} {_SIZE_UNITS[i]}" if size > 0 else "0 B"
+        for s, i, size in zip(scaled, idx, arr)
+    ]
 
 
 @dataclass
@@ -38,20 +76,16 @@ class GCSItem:
     size: int = 0
     modified: Optional[datetime] = None
     etag: Optional[str] = None
-    
+
     @property
     def size_human(self) -> str:
         """Human readable file size"""
-        if self.size == 0:
+        if self.size <= 0:
             return "0 B"
-        
-        sizes = ["B", "KB", "MB", "GB", "TB"]
-        i = 0
-        size = float(self.size)
-        while size >= 1024.0 and i < len(sizes) - 1:
-            size /= 1024.0
-            i += 1
-        return f"{size:.1f} {sizes[i]}"
+
+        # bit_length // 10 picks the unit without a division loop
+        i = min((self.size.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{self.size / (1 << (10 * i)):.1f} {_SIZE_UNITS[i]}"
 
 
 @dataclass
@@ -75,7 +109,10 @@ class DownloadJob:
 
 class GCSBrowser:
     """Main GCS Browser class"""
-    
+
+    # How long cached listings stay valid on disk (seconds)
+    CACHE_TTL = 300
+
     def __init__(self):
         self.fs = None
         self.client = None
@@ -84,6 +121,83 @@ class GCSBrowser:
         self.items_cache = {}
         self.selected_items: Set[str] = set()
         self.download_jobs: List[DownloadJob] = []
+        self.cache_enabled = True
+        self._disk_cache_dir = Path.home() / '.cache' / 'gcs_browser'
+
+    def _disk_cache_path(self, cache_key: str) -> Path:
+        """Map a cache key to a file in the on-disk cache directory"""
+        digest = hashlib.md5(cache_key.encode()).hexdigest()
+        return self._disk_cache_dir / f"{digest}.json"
+
+    def _disk_cache_get(self, cache_key: str) -> Optional[List['GCSItem']]:
+        """Load a cached listing from disk if present and not expired"""
+        try:
+            cache_file = self._disk_cache_path(cache_key)
+            if not cache_file.exists():
+                return None
+            if time.time() - cache_file.stat().st_mtime > self.CACHE_TTL:
+                return None
+
+            with open(cache_file, 'rb') as f:
+                rows = _json_loads(f.read())
+
+            items = []
+            for row in rows:
+                modified = row.get('modified')
+                items.append(GCSItem(
+                    name=row['name'],
+                    path=row['path'],
+                    type=row['type'],
+                    size=row.get('size', 0),
+                    modified=self._safe_parse_date(modified),
+                    etag=row.get('etag')
+                ))
+            return items
+        except Exception:
+            # Corrupt or unreadable cache entry - fall back to a fresh listing
+            return None
+
+    def invalidate(self, bucket: str, prefix: str = ""):
+        """Drop one listing from both cache layers
+
+        items_cache alone isn't enough: with cache_enabled the next
+        list_items would re-serve the same listing from disk for up to
+        CACHE_TTL seconds. Removing the disk entry too makes the next
+        call genuinely re-read from GCS.
+        """
+        cache_key = f"{bucket}/{prefix}"
+        self.items_cache.pop(cache_key, None)
+        try:
+            self._disk_cache_path(cache_key).unlink(missing_ok=True)
+        except OSError:
+            pass
+
+    def clear_disk_cache(self):
+        """Remove every on-disk listing entry"""
+        try:
+            for entry in self._disk_cache_dir.glob('*.json'):
+                try:
+                    entry.unlink(missing_ok=True)
+                except OSError:
+                    pass
+        except OSError:
+            pass
+
+    def _disk_cache_set(self, cache_key: str, items: List['GCSItem']):
+        """Persist a listing to the on-disk cache"""
+        try:
+            self._disk_cache_dir.mkdir(parents=True, exist_ok=True)
+            rows = []
+            for item in items:
+                row = asdict(item)
+                if isinstance(row.get('modified'), datetime):
+                    row['modified'] = row['modified'].isoformat()
+                rows.append(row)
+            with open(self._disk_cache_path(cache_key), 'wb') as f:
+                f.write(_json_dumps(rows))
+        except Exception:
+            # Caching is best-effort; never fail the listing over it
+            pass
     
     def _safe_parse_date(self, date_value):
         """Safely parse date from various formats"""
@@ -94,37 +208,56 @@ class GCSBrowser:
             return date_value
         
         if isinstance(date_value, str):
+            # GCS timestamps have the fixed shape
+            # 2023-12-01T12:34:56.789Z; fromisoformat handles it ~30x
+            # faster than dateutil's heuristic parser
+            try:
+                return datetime.fromisoformat(date_value.replace('Z', '+00:00'))
+            except ValueError:
+                pass
+
+            try:
+                return datetime.strptime(date_value, '%Y-%m-%dT%H:%M:%S.%fZ')
+            except ValueError:
+                pass
+
+            # Last resort for non-GCS formats
             if HAS_DATEUTIL:
                 try:
-                    # Try parsing with dateutil
                     return parse_date(date_value)
                 except:
                     # If that fails, return the string as-is for display
                     return date_value
-            else:
-                # Fallback: try basic ISO format parsing
-                try:
-                    # Handle common GCS datetime format: 2023-12-01T12:34:56.789Z
-                    if 'T' in date_value and date_value.endswith('Z'):
-                        # Remove Z and microseconds if present
-                        clean_date = date_value.rstrip('Z')
-                        if '.' in clean_date:
-                            clean_date = clean_date.split('.')[0]
-                        return datetime.fromisoformat(clean_date)
-                    else:
-                        return datetime.fromisoformat(date_value)
-                except:
-                    # If parsing fails, return the string for display
-                    return date_value
-        
+            return date_value
+
         return date_value
         
-    def connect(self, use_anonymous=True, credentials_path=None):
-        """Connect to GCS"""
+    def connect(self, use_anonymous=True, credentials_path=None,
+                credentials_info=None):
+        """Connect to GCS
+
+        credentials_info takes a parsed service-account dict so callers
+        holding key material in memory (e.g. an upload widget) never
+        have to write it to disk.
+        """
         try:
+            # Imported here so `gcs-browser --help` and friends don't pay
+            # for gcsfs/google-cloud-storage at module import time
+            import gcsfs
+            from google.cloud import storage
+
             if use_anonymous:
                 self.fs = gcsfs.GCSFileSystem(token='anon')
                 self.client = storage.Client.create_anonymous_client()
+            elif credentials_info:
+                from google.oauth2 import service_account
+
+                creds = service_account.Credentials.from_service_account_info(
+                    credentials_info)
+                self.fs = gcsfs.GCSFileSystem(token=credentials_info)
+                self.client = storage.Client(
+                    project=credentials_info.get('project_id'),
+                    credentials=creds)
             else:
                 if credentials_path:
                     os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = credentials_path
@@ -162,79 +295,212 @@ class GCSBrowser:
                 print("💡 Try using specific bucket names or authenticate with credentials")
             return []
     
-    def list_items(self, bucket: str, prefix: str = "") -> List[GCSItem]:
-        """List items in bucket/prefix"""
+    def _list_raw(self, bucket: str, prefix: str):
+        """One detailed listing pass partitioned into folder and file rows
+
+        Returns (folders, file_rows) where folders maps name ->
+        (path, updated or None) and file_rows holds
+        (name, path, size, updated, etag) tuples. Precomputed lengths
+        let slicing replace str.replace, and the folder dict doubles as
+        the dedupe set while keeping first-seen metadata.
+        """
+        path = f"{bucket}/{prefix}".rstrip("/")
+
+        # Get detailed listing
+        gcs_items = self.fs.ls(path, detail=True)
+
+        folders = {}
+        file_rows = []
+        bucket_slash = bucket + "/"
+        bucket_slash_len = len(bucket_slash)
+        prefix_len = len(prefix)
+        prefix_with_slash = f"{bucket_slash}{prefix.rstrip('/')}/" if prefix else bucket_slash
+
+        for item in gcs_items:
+            item_path = item['name']
+            if item_path.startswith(bucket_slash):
+                relative_path = item_path[bucket_slash_len:]
+            else:
+                relative_path = item_path
+
+            if prefix:
+                if not relative_path.startswith(prefix):
+                    continue
+                relative_path = relative_path[prefix_len:].lstrip("/")
+
+            if not relative_path:
+                continue
+
+            # Handle folders
+            if item['type'] == 'directory':
+                name = relative_path.rstrip("/").split("/")[-1]
+                if name not in folders:
+                    folders[name] = (item_path, item.get('updated'))
+            else:
+                # Handle files
+                if "/" in relative_path:
+                    # File in subfolder - create folder entry if not exists
+                    folder_name = relative_path.split("/", 1)[0]
+                    if folder_name not in folders:
+                        folders[folder_name] = (prefix_with_slash + folder_name, None)
+                else:
+                    # Direct file
+                    file_rows.append((relative_path, item_path,
+                                      item.get('size', 0),
+                                      item.get('updated'),
+                                      item.get('etag')))
+
+        return folders, file_rows
+
+    def _list_capped(self, bucket: str, prefix: str,
+                     max_results: int) -> List[GCSItem]:
+        """Delimiter listing through list_blobs with a server-side cap"""
+        prefix_q = f"{prefix.rstrip('/')}/" if prefix else ""
+        # Partial response: only the fields the UI renders, instead of
+        # full blob metadata (ACLs, MD5, owner, ...) - ~5x less payload
+        blobs = self.client.list_blobs(
+            bucket, prefix=prefix_q, delimiter='/',
+            max_results=max_results,
+            fields="items(name,size,updated,etag),prefixes,nextPageToken")
+
+        files = [
+            GCSItem(name=blob.name.rsplit('/', 1)[-1],
+                    path=f"{bucket}/{blob.name}", type="file",
+                    size=blob.size or 0, modified=blob.updated,
+                    etag=blob.etag)
+            for blob in blobs if not blob.name.endswith('/')
+        ]
+        # prefixes is populated once the iterator has been consumed
+        folders = [
+            GCSItem(name=p.rstrip('/').rsplit('/', 1)[-1],
+                    path=f"{bucket}/{p.rstrip('/')}", type="folder")
+            for p in blobs.prefixes
+        ]
+
+        items = folders + files
+        items.sort(key=lambda x: (x.type != "folder", x.name.lower()))
+        return items
+
+    def list_items_page(self, bucket: str, prefix: str = "",
+                        page_size: int = 1000, page_token=None):
+        """One delimiter-listing page plus the token for the next
+
+        Returns (items, next_page_token); next_page_token is None on
+        the last page. Needs the storage client for token support -
+        without it the full gcsfs listing comes back as a single page.
+        """
+        if self.client is None:
+            return self.list_items(bucket, prefix), None
+
+        prefix_q = f"{prefix.rstrip('/')}/" if prefix else ""
+        blobs = self.client.list_blobs(
+            bucket, prefix=prefix_q, delimiter='/',
+            page_size=page_size, page_token=page_token,
+            fields="items(name,size,updated,etag),prefixes,nextPageToken")
+
+        page = next(blobs.pages, None)
+        files = [
+            GCSItem(name=blob.name.rsplit('/', 1)[-1],
+                    path=f"{bucket}/{blob.name}", type="file",
+                    size=blob.size or 0, modified=blob.updated,
+                    etag=blob.etag)
+            for blob in (page or []) if not blob.name.endswith('/')
+        ]
+        folders = [
+            GCSItem(name=p.rstrip('/').rsplit('/', 1)[-1],
+                    path=f"{bucket}/{p.rstrip('/')}", type="folder")
+            for p in blobs.prefixes
+        ]
+
+        items = folders + files
+        items.sort(key=lambda x: (x.type != "folder", x.name.lower()))
+        return items, blobs.next_page_token
+
+    def list_items_pages(self, bucket: str, prefix: str = "",
+                         page_size: int = 1000):
+        """Yield (items, next_page_token) one page at a time
+
+        The first page arrives after a single LIST round trip, so
+        callers can show it while the rest of a huge prefix loads.
+        """
+        token = None
+        while True:
+            items, token = self.list_items_page(bucket, prefix,
+                                                page_size, token)
+            yield items, token
+            if not token:
+                return
+
+    def list_items_parallel(self, bucket: str, prefix: str = "",
+                            max_workers: int = 32) -> List[GCSItem]:
+        """List a prefix, then warm its child folders concurrently
+
+        The top-level listing is one round trip; the child listings are
+        pure network I/O, so fanning them out over a thread pool
+        overlaps the per-request RTT instead of paying it serially.
+        Each child listing lands in items_cache on the way through, so
+        the subsequent folder opens are cache hits.
+        """
+        items = self.list_items(bucket, prefix)
+        folders = [item for item in items if item.type == "folder"]
+        if len(folders) > 1:
+            prefixes = [item.path.split('/', 1)[1] for item in folders]
+            with ThreadPoolExecutor(
+                    max_workers=min(max_workers, len(folders))) as pool:
+                # Consume the map so listing errors surface here rather
+                # than being silently dropped with the pool
+                list(pool.map(lambda p: self.list_items(bucket, p),
+                              prefixes))
+        return items
+
+    def list_items(self, bucket: str, prefix: str = "",
+                   max_results: Optional[int] = None) -> List[GCSItem]:
+        """List items in bucket/prefix
+
+        max_results caps the listing server-side via list_blobs, so GCS
+        stops at the page boundary instead of walking a huge prefix.
+        Capped listings are never cached - they're partial.
+        """
         if not self.fs:
             return []
-            
+
+        if max_results is not None and self.client is not None:
+            try:
+                return self._list_capped(bucket, prefix, max_results)
+            except Exception:
+                pass  # Fall through to the full gcsfs listing
+
         cache_key = f"{bucket}/{prefix}"
         if cache_key in self.items_cache:
             return self.items_cache[cache_key]
-        
+
+        if self.cache_enabled:
+            cached = self._disk_cache_get(cache_key)
+            if cached is not None:
+                self.items_cache[cache_key] = cached
+                return cached
+
         try:
-            items = []
-            path = f"{bucket}/{prefix}".rstrip("/")
-            
-            # Get detailed listing
-            gcs_items = self.fs.ls(path, detail=True)
-            
-            # Process folders and files
-            folders_seen = set()
-            
-            for item in gcs_items:
-                item_path = item['name']
-                relative_path = item_path.replace(f"{bucket}/", "")
-                
-                if prefix:
-                    if not relative_path.startswith(prefix):
-                        continue
-                    relative_path = relative_path[len(prefix):].lstrip("/")
-                
-                if not relative_path:
-                    continue
-                
-                # Handle folders
-                if item['type'] == 'directory':
-                    name = relative_path.rstrip("/").split("/")[-1]
-                    if name not in folders_seen:
-                        items.append(GCSItem(
-                            name=name,
-                            path=item_path,
-                            type="folder",
-                            size=0,
-                            modified=self._safe_parse_date(item.get('updated'))
-                        ))
-                        folders_seen.add(name)
-                else:
-                    # Handle files
-                    if "/" in relative_path:
-                        # File in subfolder - create folder entry if not exists
-                        folder_name = relative_path.split("/")[0]
-                        if folder_name not in folders_seen:
-                            folder_path = f"{bucket}/{prefix}/{folder_name}".replace("//", "/")
-                            items.append(GCSItem(
-                                name=folder_name,
-                                path=folder_path,
-                                type="folder",
-                                size=0,
-                                modified=None
-                            ))
-                            folders_seen.add(folder_name)
-                    else:
-                        # Direct file
-                        items.append(GCSItem(
-                            name=relative_path,
-                            path=item_path,
-                            type="file",
-                            size=item.get('size', 0),
-                            modified=self._safe_parse_date(item.get('updated')),
-                            etag=item.get('etag')
-                        ))
-            
+            folders, file_rows = self._list_raw(bucket, prefix)
+
+            parse = self._safe_parse_date
+            items = [
+                GCSItem(name=name, path=folder_path, type="folder", size=0,
+                        modified=parse(updated))
+                for name, (folder_path, updated) in folders.items()
+            ]
+            items.extend(
+                GCSItem(name=name, path=file_path, type="file", size=size,
+                        modified=parse(updated), etag=etag)
+                for name, file_path, size, updated, etag in file_rows
+            )
+
             # Sort: folders first, then files, both alphabetically
             items.sort(key=lambda x: (x.type != "folder", x.name.lower()))
             
             self.items_cache[cache_key] = items
+            if self.cache_enabled:
+                self._disk_cache_set(cache_key, items)
             return items
             
         except Exception as e:
@@ -244,24 +510,86 @@ class GCSBrowser:
                 print(f"❌ Error listing items: {e}")
             return []
     
+    def list_items_df(self, bucket: str, prefix: str = ""):
+        """List items as a columnar pandas DataFrame
+
+        Skips per-row GCSItem construction entirely: columns are built
+        as plain lists and dates parse vectorized via pd.to_datetime,
+        which is much faster than per-row _safe_parse_date on big
+        listings. Columns: name, path, type, size, modified, etag.
+        """
+        import numpy as np
+        import pandas as pd
+
+        columns = ['name', 'path', 'type', 'size', 'modified', 'etag']
+        if not self.fs:
+            return pd.DataFrame(columns=columns)
+
+        try:
+            folders, file_rows = self._list_raw(bucket, prefix)
+
+            names = list(folders.keys()) + [row[0] for row in file_rows]
+            paths = [p for p, _ in folders.values()] + [row[1] for row in file_rows]
+            types = ['folder'] * len(folders) + ['file'] * len(file_rows)
+            sizes = [0] * len(folders) + [row[2] for row in file_rows]
+            updates = [u for _, u in folders.values()] + [row[3] for row in file_rows]
+            etags = [None] * len(folders) + [row[4] for row in file_rows]
+
+            df = pd.DataFrame({
+                'name': names,
+                'path': paths,
+                'type': types,
+                'size': np.array(sizes, dtype=np.int64),
+                'modified': pd.to_datetime(updates, utc=True, errors='coerce'),
+                'etag': etags,
+            })
+
+            # Sort: folders first, then files, both alphabetically
+            df = (df.assign(_is_file=df['type'] != 'folder',
+                            _name_lower=df['name'].str.lower())
+                    .sort_values(['_is_file', '_name_lower'])
+                    .drop(columns=['_is_file', '_name_lower'])
+                    .reset_index(drop=True))
+            return df
+
+        except Exception as e:
+            if HAS_STREAMLIT and 'st' in globals():
+                st.error(f"Error listing items: {e}")
+            else:
+                print(f"❌ Error listing items: {e}")
+            return pd.DataFrame(columns=columns)
+
     def get_folder_size(self, bucket: str, prefix: str) -> int:
         """Calculate total size of a folder"""
         try:
+            # Preferred: list_blobs pages 1000 objects per request and
+            # includes size in the list response - no per-object GETs
+            if self.client:
+                try:
+                    # Trailing slash, as in _list_capped: a bare prefix
+                    # would also sum sibling prefixes sharing the name
+                    # ('data' picking up 'data2/'). Partial response:
+                    # only size matters here, but the client can't
+                    # construct a blob without its name
+                    prefix_q = f"{prefix.rstrip('/')}/" if prefix else ""
+                    blobs = self.client.bucket(bucket).list_blobs(
+                        prefix=prefix_q,
+                        fields="items(name,size),nextPageToken")
+                    return sum(blob.size or 0 for blob in blobs)
+                except Exception:
+                    pass  # fall through to the gcsfs listing
+
             total_size = 0
             path = f"{bucket}/{prefix}".rstrip("/")
-            
-            # Use glob to get all files recursively
-            pattern = f"{path}/**"
-            files = self.fs.glob(pattern)
-            
-            for file_path in files:
-                try:
-                    info = self.fs.info(file_path)
-                    if info.get('type') == 'file':
-                        total_size += info.get('size', 0)
-                except:
-                    continue
-                    
+
+            # find(detail=True) returns size metadata in one batched listing
+            # instead of a per-file info() round-trip
+            entries = self.fs.find(path, detail=True, withdirs=False)
+
+            for info in entries.values():
+                if info.get('type') == 'file':
+                    total_size += info.get('size', 0)
+
             return total_size
         except Exception as e:
             if 'st' in globals():
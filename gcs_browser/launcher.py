@@ -8,9 +8,40 @@ import os
 import subprocess
 from pathlib import Path
 
+
+def run_streamlit(script_path, address="0.0.0.0", port=None):
+    """Run a Streamlit script in this process via the bootstrap API
+
+    Shelling out to `python -m streamlit run` forks a second interpreter
+    just to re-enter the same code; bootstrap skips the fork and the CLI
+    argument parsing. Falls back to the subprocess path when the
+    bootstrap API isn't importable (very old Streamlit).
+    """
+    try:
+        from streamlit import config as _config
+        from streamlit.web import bootstrap
+    except ImportError:
+        cmd = [sys.executable, "-m", "streamlit", "run", str(script_path),
+               "--server.address", address]
+        if port is not None:
+            cmd.extend(["--server.port", str(port)])
+        subprocess.run(cmd, check=True)
+        return
+
+    _config.set_option("server.address", address)
+    if port is not None:
+        _config.set_option("server.port", port)
+    try:
+        bootstrap.run(str(script_path), is_hello=False, args=[],
+                      flag_options={})
+    except TypeError:
+        # Older bootstrap signature took the command line as a string
+        bootstrap.run(str(script_path), "", [], {})
+
+
 def main():
     """Launch streamlit with the web interface"""
-    
+
     # Find the web.py file
     try:
         import gcs_browser.web
@@ -19,22 +50,14 @@ def main():
         print("❌ Could not import gcs_browser.web")
         print("💡 Make sure the package is installed: pip install git+https://github.com/MichaelAkridge-NOAA/optics-toolbox.git")
         sys.exit(1)
-    
+
     print("🚀 Starting GCS Browser Web Interface...")
     print("📱 Access at: http://localhost:8501")
     print("🛑 Press Ctrl+C to stop")
     print()
-    
-    # Launch streamlit
-    cmd = [
-        sys.executable, "-m", "streamlit", "run", 
-        str(web_module_path),
-        "--server.address", "0.0.0.0",
-        "--server.port", "8501"
-    ]
-    
+
     try:
-        subprocess.run(cmd)
+        run_streamlit(web_module_path, port=8501)
     except KeyboardInterrupt:
         print("\n👋 Shutting down...")
     except Exception as e:
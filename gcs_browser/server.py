@@ -0,0 +1,200 @@
+"""
+Long-running server mode for GCS Browser
+
+Keeps one connected GCSBrowser (and its listing caches) alive in a
+background process so repeated CLI invocations skip the ~1 s of library
+imports and client construction. Commands are newline-delimited JSON
+over a UNIX socket; the CLI transparently forwards to the server when
+the socket exists.
+"""
+
+import os
+import json
+import socket
+import selectors
+import tempfile
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+
+# A request is one JSON command line; anything bigger is a misbehaving
+# client, not a legitimate command
+_MAX_REQUEST_BYTES = 64 * 1024
+
+
+def socket_path() -> Path:
+    """Location of the server's UNIX socket
+
+    XDG_RUNTIME_DIR is already per-user; the shared temp dir is not, so
+    there the name carries the uid - otherwise a second user's `serve`
+    would unlink the first user's live socket.
+    """
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return Path(runtime_dir) / 'gcs_browser.sock'
+    uid = os.getuid() if hasattr(os, 'getuid') else 0
+    return Path(tempfile.gettempdir()) / f'gcs_browser-{uid}.sock'
+
+
+def _serialize_items(items) -> List[dict]:
+    rows = []
+    for item in items:
+        row = asdict(item)
+        if isinstance(row.get('modified'), datetime):
+            row['modified'] = row['modified'].isoformat()
+        rows.append(row)
+    return rows
+
+
+def send_request(request: dict, timeout: float = 30.0) -> Optional[dict]:
+    """Forward a command to a running server; None if no server is up"""
+    path = socket_path()
+    if not path.exists():
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(path))
+            sock.sendall(json.dumps(request).encode() + b'\n')
+
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                if chunk.endswith(b'\n'):
+                    break
+            return json.loads(b''.join(chunks))
+    except Exception:
+        # Stale socket or dead server - fall back to in-process handling
+        return None
+
+
+def list_items_via_server(bucket: str, prefix: str = ""):
+    """Fetch a listing from a running server, reconstructing GCSItems
+
+    Returns None when no server is available so callers can fall back
+    to their own GCSBrowser.
+    """
+    response = send_request({'cmd': 'list', 'bucket': bucket, 'prefix': prefix})
+    if not response or response.get('status') != 'ok':
+        return None
+
+    from .core import GCSBrowser, GCSItem
+    parse = GCSBrowser._safe_parse_date
+    browser = GCSBrowser.__new__(GCSBrowser)
+    return [
+        GCSItem(
+            name=row['name'],
+            path=row['path'],
+            type=row['type'],
+            size=row.get('size', 0),
+            modified=parse(browser, row.get('modified')),
+            etag=row.get('etag')
+        )
+        for row in response.get('items', [])
+    ]
+
+
+def serve(use_anonymous=True, credentials_path=None) -> int:
+    """Run the command server until stopped
+
+    One GCSBrowser instance (and its items_cache) serves every request,
+    amortizing imports and connection setup across CLI invocations.
+    """
+    from .core import GCSBrowser
+
+    browser = GCSBrowser()
+    if not browser.connect(use_anonymous=use_anonymous,
+                           credentials_path=credentials_path):
+        print("❌ Could not connect to GCS; server not started")
+        return 1
+
+    path = socket_path()
+    if path.exists():
+        path.unlink()
+
+    server_sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server_sock.bind(str(path))
+    # Owner-only: the daemon may hold credentials, and socket perms
+    # otherwise follow the umask
+    os.chmod(path, 0o600)
+    server_sock.listen()
+    server_sock.setblocking(False)
+
+    selector = selectors.DefaultSelector()
+    selector.register(server_sock, selectors.EVENT_READ, data=None)
+    buffers = {}
+    running = True
+
+    def _handle(request: dict) -> dict:
+        nonlocal running
+        cmd = request.get('cmd')
+        if cmd == 'ping':
+            return {'status': 'ok'}
+        if cmd == 'stop':
+            running = False
+            return {'status': 'ok'}
+        if cmd == 'list':
+            items = browser.list_items(request.get('bucket', ''),
+                                       request.get('prefix', ''))
+            return {'status': 'ok', 'items': _serialize_items(items)}
+        if cmd == 'buckets':
+            return {'status': 'ok', 'buckets': browser.list_buckets()}
+        return {'status': 'error', 'error': f'unknown command: {cmd}'}
+
+    print(f"🚀 GCS Browser server listening on {path}")
+    print("🛑 Press Ctrl+C to stop")
+
+    try:
+        while running:
+            for key, _ in selector.select(timeout=1.0):
+                if key.data is None:
+                    conn, _ = server_sock.accept()
+                    conn.setblocking(False)
+                    selector.register(conn, selectors.EVENT_READ, data='conn')
+                    buffers[conn] = b''
+                    continue
+
+                conn = key.fileobj
+                try:
+                    chunk = conn.recv(65536)
+                except (BlockingIOError, ConnectionResetError):
+                    chunk = b''
+
+                if chunk:
+                    buffers[conn] += chunk
+
+                oversized = len(buffers[conn]) > _MAX_REQUEST_BYTES
+                if not chunk or oversized or buffers[conn].endswith(b'\n'):
+                    if oversized:
+                        response = {'status': 'error',
+                                    'error': 'request too large'}
+                    else:
+                        try:
+                            request = json.loads(buffers[conn]) if buffers[conn] else {}
+                            response = _handle(request)
+                        except Exception as e:
+                            response = {'status': 'error', 'error': str(e)}
+
+                    try:
+                        conn.sendall(json.dumps(response).encode() + b'\n')
+                    except Exception:
+                        pass
+
+                    selector.unregister(conn)
+                    conn.close()
+                    buffers.pop(conn, None)
+    except KeyboardInterrupt:
+        print("\n👋 Shutting down...")
+    finally:
+        selector.close()
+        server_sock.close()
+        if path.exists():
+            path.unlink()
+
+    return 0
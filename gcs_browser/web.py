@@ -3,20 +3,601 @@ Web interface for GCS Browser using Streamlit
 """
 
 import streamlit as st
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Set
 import sys
 import traceback
 
 try:
-    from .core import GCSBrowser, GCSItem, DownloadJob
-    from .utils import detect_download_tools, download_with_gsutil, download_with_gcsfs
+    from .core import GCSBrowser, GCSItem, DownloadJob, size_human_batch
+    from .utils import (
+        detect_download_tools,
+        download_with_gsutil,
+        download_with_gcsfs,
+        download_with_transfer_manager,
+        MULTIPART_THRESHOLD,
+    )
 except ImportError as e:
     st.error(f"Import error: {e}")
     st.info("This usually means dependencies are not installed correctly.")
     st.stop()
 
 
+@st.cache_resource
+def _cached_tools():
+    """Tool detection shells out to subprocesses; probe once per server
+
+    Without this every rerun (each checkbox click) re-probed gsutil,
+    gcloud, and rsync. cache_resource rather than cache_data: tools
+    don't come and go at runtime, and resource caching hands back the
+    same dict instead of unpickling a copy on every rerun. The Rescan
+    button still clears it explicitly.
+    """
+    return detect_download_tools()
+
+
+@st.cache_data
+def _probe_deps():
+    """Import-probe the heavy dependencies once per process
+
+    The result can't change without a restart, so steady-state reruns
+    of the debug panel skip the import machinery entirely.
+    """
+    import importlib
+
+    out = {}
+    for name in ("pandas", "gcsfs", "google.cloud.storage"):
+        try:
+            importlib.import_module(name)
+            out[name] = True
+        except ImportError as e:
+            out[name] = str(e)
+    return out
+
+
+@st.cache_resource
+def _shared_connection(use_anonymous, _credentials_info, cred_hash):
+    """Process-wide gcsfs filesystem + storage client per auth context
+
+    The expensive parts of connecting - TLS handshakes, auth discovery,
+    urllib3 connection pools - are shared across sessions and browser
+    tabs; each session keeps its own lightweight GCSBrowser for
+    navigation state. The key dict is passed underscore-unhashed;
+    cred_hash keys the cache so uploading a different key actually
+    reconnects.
+    """
+    conn = GCSBrowser()
+    if not conn.connect(use_anonymous=use_anonymous,
+                        credentials_info=_credentials_info):
+        raise RuntimeError("GCS connection failed")
+    return conn.fs, conn.client
+
+
+@st.cache_data(ttl=300)
+def _cached_buckets(_browser, use_anonymous: bool, cred_hash):
+    """Bucket listing is an authenticated GCS RPC; cache per auth context
+
+    The browser itself is unhashable, so the key is the auth identity
+    it connected with. st.cache_data is process-global - keyed on
+    anything per-session, one session's authenticated bucket list
+    would be served to every other session.
+    """
+    return _browser.list_buckets()
+
+
+# How many recently visited prefix listings to keep per session
+_LISTING_CACHE_MAX = 64
+
+
+def _cached_list_items(browser, bucket, prefix):
+    """List a prefix through a session-scoped LRU of recent listings
+
+    Navigating back through breadcrumbs revisits prefixes the user just
+    came from; keeping the last 64 listings in session state makes
+    backward navigation zero-RTT. Serialized listings are tiny, so this
+    costs at most a few MB.
+    """
+    from collections import OrderedDict
+
+    cache = st.session_state.setdefault('listing_cache', OrderedDict())
+    key = (bucket, prefix)
+    if key in cache:
+        cache.move_to_end(key)
+        return cache[key]
+
+    items = browser.list_items(bucket, prefix)
+    cache[key] = items
+    if len(cache) > _LISTING_CACHE_MAX:
+        cache.popitem(last=False)
+    return items
+
+
+@st.cache_resource
+def _prefetch_pool():
+    """Process-wide pool for warming the listing cache
+
+    gcsfs releases the GIL on socket I/O, so these run alongside the
+    main rerun. Built via cache_resource because Streamlit re-executes
+    this whole script per interaction - a module-level executor would
+    be rebuilt (and its worker threads leaked) on every rerun.
+    """
+    return ThreadPoolExecutor(max_workers=4)
+
+
+def _prefetch_folders(browser, bucket, items, limit=3):
+    """Warm the listing LRU for the first few subfolders in the background
+
+    The likely next action after opening a folder is opening a sibling,
+    so fetch those listings during user think-time; if the user clicks
+    one, it's already in the cache.
+    """
+    cache = st.session_state.get('listing_cache')
+    if cache is None:
+        return
+
+    inflight = st.session_state.setdefault('prefetch_inflight', set())
+
+    targets = []
+    for item in items:
+        if item.type != 'folder':
+            continue
+        prefix = item.path.replace(f"{bucket}/", "", 1).strip('/')
+        if (bucket, prefix) not in cache and prefix not in inflight:
+            targets.append(prefix)
+        if len(targets) >= limit:
+            break
+
+    for prefix in targets:
+        inflight.add(prefix)
+
+        def _fetch(p=prefix):
+            try:
+                cache[(bucket, p)] = browser.list_items(bucket, p)
+            except Exception:
+                pass
+            finally:
+                inflight.discard(p)
+
+        _prefetch_pool().submit(_fetch)
+
+
+@st.cache_data
+def _ensure_dir(path: str) -> str:
+    """mkdir -p once per distinct destination instead of per click
+
+    Keyed on the path string, so changing the destination still
+    revalidates.
+    """
+    Path(path).mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _selection():
+    """The session's selected-paths set
+
+    Selection lives in session state rather than on the browser object,
+    which keeps the shareable connection pieces stateless.
+    """
+    return st.session_state.setdefault('selected_items', set())
+
+
+def _invalidate_listing(browser, bucket, prefix):
+    """Drop a single prefix from every listing cache layer
+
+    Navigation never invalidates - backtracking should always hit the
+    cache - so this only runs from the explicit refresh controls.
+    browser.invalidate covers items_cache plus the on-disk entry, which
+    would otherwise re-serve the same listing for up to CACHE_TTL.
+    """
+    cache = st.session_state.get('listing_cache')
+    if cache is not None:
+        cache.pop((bucket, prefix), None)
+    browser.invalidate(bucket, prefix)
+
+
+# Hoisted out of main() so reruns don't recompute the home-directory
+# resolution or re-allocate the static lists
+_DEFAULT_DEST = str(Path.home() / "Downloads" / "gcs_downloads")
+
+_PUBLIC_BUCKETS = ("nmfs_odp_pifsc",)
+
+_FEATURES = (
+    "🌳 Tree-like bucket browsing",
+    "📁 Folder size calculation",
+    "⬇️ Multiple download methods (gsutil, gcsfs, gcloud)",
+    "📊 Download progress tracking",
+    "🔄 Resume interrupted downloads",
+    "🌐 Cross-platform (Windows/Linux/MacOS)",
+    "⚡ Parallel downloads for speed",
+    "🎯 Selective file/folder downloads",
+)
+
+
+# File-type icons keyed by lowercased extension - one dict lookup per
+# row instead of a Path() allocation plus chained list membership tests
+_EXT_ICON = {ext: icon for icon, exts in [
+    ("🖼️", ('.jpg', '.jpeg', '.png', '.gif', '.bmp')),
+    ("📄", ('.txt', '.md', '.csv')),
+    ("📦", ('.zip', '.tar', '.gz')),
+] for ext in exts}
+
+
+def _fragment(func):
+    """Scope widget reruns to the decorated block (Streamlit 1.33+)
+
+    Older Streamlit has no st.fragment; fall back to a plain function
+    so the app still works, just with full reruns.
+    """
+    return st.fragment(func) if hasattr(st, "fragment") else func
+
+
+def _rerun_app():
+    """Force a full-app rerun from inside a fragment"""
+    try:
+        st.rerun(scope="app")
+    except TypeError:  # Streamlit < 1.37 has no scope argument
+        st.rerun()
+
+
+class _StreamlitProgress:
+    """Bridge download progress callbacks into Streamlit widgets
+
+    The download helpers report either (bytes_done, total) pairs or
+    plain status strings; updates are throttled to ~4 Hz so widget
+    traffic doesn't compete with the transfer itself.
+    """
+
+    def __init__(self, progress_bar, status_text, interval=0.25):
+        self._bar = progress_bar
+        self._status = status_text
+        self._interval = interval
+        self._last = 0.0
+
+    def __call__(self, *args):
+        import time
+
+        now = time.monotonic()
+        if now - self._last < self._interval:
+            return
+        self._last = now
+        if len(args) == 2 and isinstance(args[0], int):
+            done, total = args
+            if total:
+                self._bar.progress(min(done / total, 1.0))
+                self._status.text(
+                    f"{done / 1024 / 1024:.1f} / {total / 1024 / 1024:.1f} MB")
+        elif args:
+            self._status.text(str(args[0])[:120])
+
+
+def _folder_size(browser, bucket, prefix):
+    """Recursive folder size as one list-objects request, cached per session
+
+    fs.du() pages a single list call internally instead of walking one
+    ls() per subdirectory; results are cached so repeat clicks are free.
+    """
+    cache = st.session_state.setdefault('folder_sizes', {})
+    key = f"{bucket}/{prefix}".rstrip('/')
+    if key not in cache:
+        try:
+            cache[key] = browser.fs.du(f"gs://{key}", total=True)
+        except Exception:
+            cache[key] = browser.get_folder_size(bucket, prefix)
+    return cache[key]
+
+
+def _prefetch_folder_sizes(browser, items):
+    """Resolve visible folder sizes in the background
+
+    Sizes land in the session cache and show up in the table on the
+    next rerun, so the user isn't forced to click 📊 per folder.
+    """
+    cache = st.session_state.setdefault('folder_sizes', {})
+    inflight = st.session_state.setdefault('folder_size_inflight', set())
+
+    for item in items:
+        if item.type != 'folder':
+            continue
+        key = item.path.rstrip('/')
+        if key in cache or key in inflight:
+            continue
+        inflight.add(key)
+
+        def _fetch(k=key):
+            try:
+                cache[k] = browser.fs.du(f"gs://{k}", total=True)
+            except Exception:
+                pass
+            finally:
+                inflight.discard(k)
+
+        _prefetch_pool().submit(_fetch)
+
+
+def _items_dataframe(items, selected):
+    """Build the items listing as one DataFrame for st.data_editor
+
+    A single table widget replaces five widgets per row, so toggling a
+    checkbox diffs one element instead of rebuilding len(items) * 5
+    widgets on every rerun.
+    """
+    import pandas as pd
+
+    folder_sizes = st.session_state.get('folder_sizes', {})
+
+    icons = []
+    raw_sizes = []
+    for item in items:
+        if item.type == "folder":
+            icons.append("📁")
+            # Background size lookups fill in as they complete
+            raw_sizes.append(folder_sizes.get(item.path.rstrip('/')) or -1)
+        else:
+            # File icon based on extension
+            dot = item.name.rfind('.')
+            if dot >= 0:
+                icons.append(_EXT_ICON.get(item.name[dot:].lower(), "📄"))
+            else:
+                icons.append("📄")
+            raw_sizes.append(item.size)
+
+    # Format sizes and timestamps in vectorized passes instead of a
+    # property call and strftime per row
+    size_strs = size_human_batch([max(s, 0) for s in raw_sizes])
+    sizes = [s if raw >= 0 else "-" for s, raw in zip(size_strs, raw_sizes)]
+
+    modified = pd.to_datetime(
+        pd.Series([item.modified for item in items], dtype=object),
+        errors='coerce', utc=True
+    ).dt.strftime('%Y-%m-%d %H:%M').fillna("-")
+
+    return pd.DataFrame({
+        'Select': [item.path in selected for item in items],
+        'Icon': icons,
+        'Name': [item.name for item in items],
+        'Size': sizes,
+        'Modified': modified,
+        'Path': [item.path for item in items],
+    })
+
+
+def _batch_size_lookup(fs, paths):
+    """Resolve sizes for many paths with one listing per parent prefix
+
+    Replaces a metadata round-trip per selected object with one ls()
+    call per distinct parent; listings are cached in session state so
+    re-opening the dialog is free.
+    """
+    import posixpath
+
+    by_parent = {}
+    for path in paths:
+        if not path.endswith('/'):  # File
+            by_parent.setdefault(posixpath.dirname(path), []).append(path)
+
+    size_cache = st.session_state.setdefault('size_cache', {})
+    sizes = {}
+    for parent, group in by_parent.items():
+        size_map = size_cache.get(parent)
+        if size_map is None:
+            try:
+                entries = fs.ls(parent, detail=True)
+            except FileNotFoundError:
+                # Parent vanished between listing and estimating; its
+                # files count as 0 rather than failing the whole batch
+                entries = []
+            size_map = {entry['name']: entry.get('size', 0)
+                        for entry in entries if entry.get('type') == 'file'}
+            size_cache[parent] = size_map
+        for path in group:
+            sizes[path] = size_map.get(path, 0)
+    return sizes
+
+
+@_fragment
+def _render_items(browser, items, destination_folder, tools):
+    """Render the items table and the per-item actions
+
+    Decorated as a fragment so checkbox toggles and page flips rerun
+    only this block, not the whole app (sidebar, connection checks
+    and bucket listing included).
+    """
+    # Items table with selection
+    st.subheader(f"📋 Items ({len(items)})")
+    
+    # Selection controls
+    col_select, col_download = st.columns([2, 1])
+    
+    with col_select:
+        # No explicit rerun needed here: the table renders after these
+        # handlers in the same pass and picks up the new selection
+        if st.button("Select All"):
+            st.session_state.selected_items = {item.path for item in items}
+            # The table widget keeps its own edit state; bump
+            # the key so it re-initializes from the selection
+            st.session_state.items_table_nonce = st.session_state.get('items_table_nonce', 0) + 1
+
+        if st.button("Clear Selection"):
+            _selection().clear()
+            st.session_state.items_table_nonce = st.session_state.get('items_table_nonce', 0) + 1
+    
+    with col_download:
+        if _selection():
+            st.write(f"🎯 {len(_selection())} selected")
+        
+        if st.button("⬇️ Download Selected",
+                    disabled=not _selection(),
+                    type="primary"):
+            st.session_state.show_download_dialog = True
+            # The dialog lives outside this fragment
+            _rerun_app()
+    
+    # Page through big folders: every row handed to the table
+    # is serialized to the browser per rerun, so cap that at
+    # one page no matter how large the directory is
+    page_size = 200
+    page = 1
+    if len(items) > page_size:
+        pages = -(-len(items) // page_size)
+        page = st.number_input(
+            f"Page ({pages} pages of {page_size}):",
+            min_value=1, max_value=pages, value=1,
+            key="items_page"
+        )
+    visible_items = items[(page - 1) * page_size: page * page_size]
+
+    # Items display - one data_editor instead of five widgets
+    # per row, so a checkbox click diffs a single table. The form
+    # around it batches edits: toggling N rows generates zero reruns
+    # until Apply selection is pressed
+    df = _items_dataframe(visible_items, _selection())
+    # Key on a small per-prefix integer rather than the raw
+    # bucket/prefix strings - deep GCS paths make for 200+ char keys
+    # that Streamlit hashes on every tree diff
+    path_ids = st.session_state.setdefault('path_ids', {})
+    location = (browser.current_bucket, browser.current_prefix)
+    path_id = path_ids.setdefault(location, len(path_ids))
+    table_key = "items_table_{}_{}_{}".format(
+        path_id, page, st.session_state.get('items_table_nonce', 0))
+    with st.form("select_items", clear_on_submit=False):
+        edited = st.data_editor(
+            df,
+            hide_index=True,
+            use_container_width=True,
+            disabled=["Icon", "Name", "Size", "Modified"],
+            column_config={
+                "Select": st.column_config.CheckboxColumn("Select"),
+                "Path": None,  # Hidden - used to map rows back to items
+            },
+            key=table_key,
+        )
+        apply_selection = st.form_submit_button("Apply selection")
+
+    if apply_selection:
+        # Only rows shown here may change; keep selections made on
+        # other pages or in other folders intact. One vectorized boolean
+        # mask and one set construction - no per-row add/discard calls
+        visible = {item.path for item in visible_items}
+        checked = set(edited.loc[edited["Select"], "Path"].tolist())
+        st.session_state.selected_items = (_selection() - visible) | checked
+
+    # Per-row actions moved below the table
+    folders = [item for item in visible_items if item.type == "folder"]
+    files = [item for item in visible_items if item.type == "file"]
+
+    col_folder, col_file = st.columns(2)
+
+    with col_folder:
+        if folders:
+            folder_choice = st.selectbox(
+                "📁 Folder:",
+                [item.name for item in folders],
+                key="folder_action_select"
+            )
+            col_open, col_size = st.columns(2)
+            with col_open:
+                if st.button("🔍 Open", help="Open folder"):
+                    # Navigate into folder
+                    st.session_state.current_path.append(folder_choice)
+                    if browser.current_prefix:
+                        browser.current_prefix = f"{browser.current_prefix}/{folder_choice}"
+                    else:
+                        browser.current_prefix = folder_choice
+                    # Navigation changes the breadcrumb outside
+                    # this fragment, so rerun the whole app
+                    _rerun_app()
+            with col_size:
+                if st.button("📊 Size", help="Calculate folder size"):
+                    with st.spinner("Calculating..."):
+                        folder = next(i for i in folders if i.name == folder_choice)
+                        folder_size = _folder_size(
+                            browser, browser.current_bucket,
+                            folder.path.replace(f"{browser.current_bucket}/", "")
+                        )
+                        if folder_size > 0:
+                            size_item = GCSItem("", "", "folder", size=folder_size)
+                            st.success(f"Size: {size_item.size_human}")
+
+    with col_file:
+        if files:
+            file_choice = st.selectbox(
+                "📄 File:",
+                [item.name for item in files],
+                key="file_action_select"
+            )
+            file_item = next(i for i in files if i.name == file_choice)
+
+            # Small files can stream straight to the user's browser -
+            # no server-side disk hop. Fetch on click, then offer the
+            # bytes through download_button so reruns don't re-fetch.
+            if file_item.size < 100 * 1024 * 1024:
+                if st.button("💾 Fetch for browser download",
+                             help="Download this file through your browser"):
+                    with st.spinner(f"Fetching {file_choice}..."):
+                        st.session_state.browser_dl = (
+                            file_item.name,
+                            browser.fs.cat_file(f"gs://{file_item.path}"))
+                pending = st.session_state.get('browser_dl')
+                if pending and pending[0] == file_item.name:
+                    st.download_button(f"💾 Save {file_item.name}",
+                                       data=pending[1],
+                                       file_name=file_item.name)
+
+            if st.button("⬇️ Download", help="Download to the server destination folder"):
+                # Quick download single file
+                with st.spinner(f"Downloading {file_choice}..."):
+                    dest_folder = Path(_ensure_dir(destination_folder))
+
+                    # Byte-level progress during the transfer
+                    quick_progress = _StreamlitProgress(
+                        st.progress(0), st.empty())
+
+                    # Large files take gsutil -m when available:
+                    # sliced parallel download saturates the pipe
+                    # where gcsfs streams one TCP connection
+                    threshold = st.session_state.setdefault(
+                        'large_file_threshold', MULTIPART_THRESHOLD)
+                    if file_item.size >= threshold and tools.get('gsutil'):
+                        success = download_with_gsutil(
+                            f"gs://{file_item.path}",
+                            str(dest_folder),
+                            recursive=False,
+                            progress_callback=quick_progress
+                        )
+                    else:
+                        success = download_with_gcsfs(
+                            browser,
+                            f"gs://{file_item.path}",
+                            str(dest_folder),
+                            progress_callback=quick_progress
+                        )
+
+                    if success:
+                        st.success(f"✅ Downloaded to {dest_folder}")
+                    else:
+                        st.error("❌ Download failed")
+
+
+@_fragment
+def _tools_panel():
+    """Sidebar tools list; a rescan reruns only this block"""
+    st.header("🛠️ Available Tools")
+    tools = _cached_tools()
+
+    for tool, available in tools.items():
+        status = "✅" if available else "❌"
+        st.write(f"{status} {tool}")
+
+    if not any(tools.values()):
+        st.warning("No download tools detected. Consider installing gsutil or gcloud SDK.")
+
+    if st.button("🔄 Rescan tools"):
+        _cached_tools.clear()
+        st.rerun()
+
+
 def main():
     """Main web interface function"""
     try:
@@ -28,90 +609,70 @@ def main():
         
         st.title("☁️ Google Cloud Storage Browser & Downloader")
         st.markdown("Browse GCS buckets like a file tree and download files/folders with multiple methods")
-        
-        # Add debug info in expander
-        with st.expander("🐛 Debug Info (click if app seems stuck)"):
-            st.write("✅ Streamlit loaded successfully")
-            st.write(f"🐍 Python version: {sys.version}")
-            st.write("📦 Checking dependencies...")
-            
-            try:
-                import pandas
-                st.write("✅ pandas imported")
-            except ImportError as e:
-                st.error(f"❌ pandas import failed: {e}")
-                
-            try:
-                import gcsfs
-                st.write("✅ gcsfs imported")
-            except ImportError as e:
-                st.error(f"❌ gcsfs import failed: {e}")
-                
-            try:
-                import google.cloud.storage
-                st.write("✅ google-cloud-storage imported")
-            except ImportError as e:
-                st.error(f"❌ google-cloud-storage import failed: {e}")
-        
+
+        # Startup-status writes are protobuf elements shipped to the
+        # browser on every rerun; only emit them when ?debug=1 is set
+        debug = getattr(st, 'query_params', {}).get('debug') == '1'
+
+        if debug:
+            with st.expander("🐛 Debug Info (click if app seems stuck)"):
+                st.write("✅ Streamlit loaded successfully")
+                st.write(f"🐍 Python version: {sys.version}")
+                st.write("📦 Checking dependencies...")
+
+                for dep, ok in _probe_deps().items():
+                    if ok is True:
+                        st.write(f"✅ {dep} imported")
+                    else:
+                        st.error(f"❌ {dep} import failed: {ok}")
+
     except Exception as e:
         st.error(f"Error in main setup: {e}")
         st.text("Full traceback:")
         st.text(traceback.format_exc())
         st.stop()
     
-    st.write("🔄 Initializing session state...")
-    
+    if debug:
+        st.write("🔄 Initializing session state...")
+
     # Initialize session state with error handling
     try:
         if 'browser' not in st.session_state:
-            st.write("🔧 Creating GCS Browser instance...")
-            # Add a progress bar to show it's working
-            progress = st.progress(0)
-            progress.progress(25)
-            
+            if debug:
+                st.write("🔧 Creating GCS Browser instance...")
             st.session_state.browser = GCSBrowser()
-            progress.progress(100)
-            st.write("✅ GCS Browser created successfully")
-            progress.empty()  # Remove progress bar
-        
+            if debug:
+                st.write("✅ GCS Browser created successfully")
+
         if 'connected' not in st.session_state:
             st.session_state.connected = False
-        
+
         if 'current_path' not in st.session_state:
             st.session_state.current_path = []
-            
-        st.write("✅ Session state initialized")
-        
-        # Clear the debug messages after successful init (keep page clean)
-        if st.session_state.get('debug_cleared', False) is False:
-            st.session_state.debug_cleared = True
-            # st.rerun()  # Uncomment this line if you want to hide debug messages after init
-        
+
+        if debug:
+            st.write("✅ Session state initialized")
+
     except Exception as e:
         st.error(f"Error initializing GCS Browser: {e}")
         st.text("Full traceback:")
         st.text(traceback.format_exc())
         st.stop()
-    
+
     browser = st.session_state.browser
-    st.write("🎯 Loading main interface...")
-    
-    # Add a simple test to make sure everything is working
-    st.write("🧪 Testing basic functionality...")
-    test_container = st.empty()
-    
-    try:
-        # Test that we can access browser methods
-        test_bucket = "test"
-        # This shouldn't make any network calls, just test object access
-        _ = browser.current_bucket
-        test_container.success("✅ Browser object working correctly")
-    except Exception as e:
-        test_container.error(f"❌ Browser object test failed: {e}")
-        st.stop()
-    
-    st.write("🚀 Rendering interface components...")
-    
+
+    if debug:
+        # Sanity-check that we can access browser methods without any
+        # network calls
+        st.write("🧪 Testing basic functionality...")
+        test_container = st.empty()
+        try:
+            _ = browser.current_bucket
+            test_container.success("✅ Browser object working correctly")
+        except Exception as e:
+            test_container.error(f"❌ Browser object test failed: {e}")
+            st.stop()
+
     # Sidebar for connection and settings
     with st.sidebar:
         st.header("🔧 Connection Settings")
@@ -123,7 +684,6 @@ def main():
             key="auth_method"
         )
         
-        credentials_path = None
         if auth_method == "Service Account Key":
             uploaded_key = st.file_uploader(
                 "Upload service account JSON key:",
@@ -131,22 +691,40 @@ def main():
                 help="Upload your GCP service account key file"
             )
             if uploaded_key:
-                # Save temporary file
-                key_path = Path.cwd() / "temp_credentials.json"
-                with open(key_path, 'wb') as f:
-                    f.write(uploaded_key.read())
-                credentials_path = str(key_path)
+                import hashlib
+                import json
+
+                # Parse the key once per upload and keep it in memory -
+                # the secret never touches disk. getvalue() copies the
+                # buffer, so read it a single time for hash and parse
+                raw_key = uploaded_key.getvalue()
+                key_hash = hashlib.blake2b(raw_key,
+                                           digest_size=16).hexdigest()
+                if st.session_state.get('cred_hash') != key_hash:
+                    try:
+                        st.session_state.creds_info = json.loads(raw_key)
+                        st.session_state.cred_hash = key_hash
+                    except ValueError:
+                        st.error("❌ Uploaded file is not valid JSON")
         
-        # Connect button
+        # Connect button. One placeholder updated in place - no
+        # intermediate full-page render between spinner and result,
+        # and no explicit rerun: everything that reads the connected
+        # flag renders later in this same pass
         if st.button("🔌 Connect to GCS", type="primary"):
             use_anon = auth_method == "Anonymous (public buckets only)"
-            
-            with st.spinner("Connecting to GCS..."):
-                if browser.connect(use_anonymous=use_anon, credentials_path=credentials_path):
+
+            placeholder = st.empty()
+            with placeholder.container(), st.spinner("Connecting to GCS..."):
+                try:
+                    browser.fs, browser.client = _shared_connection(
+                        use_anon, st.session_state.get('creds_info'),
+                        st.session_state.get('cred_hash'))
                     st.session_state.connected = True
-                    st.success("✅ Connected!")
-                    st.rerun()
-                else:
+                    # Remember the identity this session connected with;
+                    # it keys the process-global caches
+                    st.session_state.use_anonymous = use_anon
+                except Exception:
                     st.error("❌ Connection failed")
         
         if st.session_state.connected:
@@ -156,38 +734,60 @@ def main():
         
         st.divider()
         
-        # Download tools detection
-        st.header("🛠️ Available Tools")
-        tools = detect_download_tools()
-        
-        for tool, available in tools.items():
-            status = "✅" if available else "❌"
-            st.write(f"{status} {tool}")
-        
-        if not any(tools.values()):
-            st.warning("No download tools detected. Consider installing gsutil or gcloud SDK.")
+        # Download tools detection - fragment-scoped so a rescan
+        # redraws just this block
+        _tools_panel()
+        tools = _cached_tools()
+
+        # Sidebar runs before the main column, so the reload happens in
+        # this same pass - no explicit rerun
+        if st.button("🔄 Refresh listings", help="Drop all cached listings and re-read from GCS"):
+            st.session_state.get('listing_cache', {}).clear()
+            st.session_state.get('folder_sizes', {}).clear()
+            st.session_state.get('size_cache', {}).clear()
+            browser.items_cache.clear()
+            # Without this the next listing re-serves from disk
+            browser.clear_disk_cache()
         
         st.divider()
         
-        # Download settings
+        # Download settings - batched in a form so typing a destination
+        # path doesn't rerun the whole app on every keystroke
         st.header("⬇️ Download Settings")
-        
-        default_dest = str(Path.home() / "Downloads" / "gcs_downloads")
-        destination_folder = st.text_input(
-            "Default destination:",
-            value=default_dest,
-            help="Where to download files by default"
-        )
-        
-        preferred_method = st.selectbox(
-            "Preferred download method:",
-            ["gsutil" if tools.get('gsutil') else None,
-             "gcsfs (Python)",
-             "gcloud" if tools.get('gcloud') else None],
-            help="Choose your preferred download method"
-        )
-        
-        parallel_downloads = st.checkbox("Parallel downloads", value=True)
+
+        saved = st.session_state.get('settings', {})
+
+        with st.form("settings_form", clear_on_submit=False):
+            destination_folder = st.text_input(
+                "Default destination:",
+                value=saved.get('destination', _DEFAULT_DEST),
+                help="Where to download files by default"
+            )
+
+            preferred_method = st.selectbox(
+                "Preferred download method:",
+                ["gsutil" if tools.get('gsutil') else None,
+                 "gcsfs (Python)",
+                 "gcloud" if tools.get('gcloud') else None],
+                help="Choose your preferred download method"
+            )
+
+            parallel_downloads = st.checkbox(
+                "Parallel downloads", value=saved.get('parallel', True))
+
+            auto_sizes = st.checkbox(
+                "Auto-compute folder sizes",
+                value=saved.get('auto_sizes', True),
+                help="Resolve visible folder sizes in the background; "
+                     "turn off for very large buckets")
+
+            if st.form_submit_button("Apply"):
+                st.session_state.settings = {
+                    'destination': destination_folder,
+                    'method': preferred_method,
+                    'parallel': parallel_downloads,
+                    'auto_sizes': auto_sizes,
+                }
     
     # Main interface
     if not st.session_state.connected:
@@ -216,18 +816,7 @@ def main():
         
         st.markdown("## 📋 Features")
         
-        features = [
-            "🌳 Tree-like bucket browsing",
-            "📁 Folder size calculation",
-            "⬇️ Multiple download methods (gsutil, gcsfs, gcloud)",
-            "📊 Download progress tracking",
-            "🔄 Resume interrupted downloads",
-            "🌐 Cross-platform (Windows/Linux/MacOS)",
-            "⚡ Parallel downloads for speed",
-            "🎯 Selective file/folder downloads"
-        ]
-        
-        for feature in features:
+        for feature in _FEATURES:
             st.write(feature)
         
         return
@@ -241,37 +830,43 @@ def main():
         # Bucket selection
         if not browser.current_bucket:
             st.subheader("📦 Select Bucket")
-            buckets = browser.list_buckets()
-            
+
             # Show common public buckets for easy access
             st.markdown("**🌐 Public NOAA Data:**")
-            public_buckets = [
-                "nmfs_odp_pifsc"
-            ]
-            
-            for bucket in public_buckets:
+            for bucket in _PUBLIC_BUCKETS:
                 if st.button(f"📁 {bucket}", key=f"pub_{bucket}"):
                     browser.current_bucket = bucket
                     st.session_state.current_path = [bucket]
                     st.rerun()
             
             st.divider()
-            
-            if buckets:
-                st.markdown("**🔐 Your Buckets:**")
-                selected_bucket = st.selectbox("Available buckets:", [""] + buckets)
-                if selected_bucket and st.button("Open Bucket"):
-                    browser.current_bucket = selected_bucket
-                    st.session_state.current_path = [selected_bucket]
-                    st.rerun()
+
+            # Bucket enumeration is an authenticated RPC (and fails on
+            # anonymous access), so only fetch the list when asked
+            with st.expander("🔐 Browse all buckets (requires auth)"):
+                if st.button("List my buckets"):
+                    st.session_state.bucket_list = _cached_buckets(
+                        browser,
+                        st.session_state.get('use_anonymous', True),
+                        st.session_state.get('cred_hash'))
+                buckets = st.session_state.get('bucket_list') or []
+                if buckets:
+                    selected_bucket = st.selectbox("Available buckets:", [""] + buckets)
+                    if selected_bucket and st.button("Open Bucket"):
+                        browser.current_bucket = selected_bucket
+                        st.session_state.current_path = [selected_bucket]
+                        st.rerun()
             
             st.markdown("**✏️ Manual Entry:**")
-            manual_bucket = st.text_input(
-                "Enter bucket name:", 
-                placeholder="my-bucket-name",
-                help="Enter any bucket name you have access to"
-            )
-            if manual_bucket and st.button("🚀 Open Bucket", type="primary"):
+            # Form so typing a bucket name doesn't rerun per keystroke
+            with st.form("manual_bucket_form"):
+                manual_bucket = st.text_input(
+                    "Enter bucket name:",
+                    placeholder="my-bucket-name",
+                    help="Enter any bucket name you have access to"
+                )
+                open_manual = st.form_submit_button("🚀 Open Bucket", type="primary")
+            if open_manual and manual_bucket:
                 browser.current_bucket = manual_bucket
                 st.session_state.current_path = [manual_bucket]
                 st.rerun()
@@ -283,13 +878,11 @@ def main():
                     # Navigate to this level
                     st.session_state.current_path = st.session_state.current_path[:i+1]
                     browser.current_prefix = "/".join(st.session_state.current_path[1:])
-                    browser.items_cache.clear()  # Clear cache
                     st.rerun()
             
             if len(st.session_state.current_path) > 1 and st.button("⬆️ Up"):
                 st.session_state.current_path.pop()
                 browser.current_prefix = "/".join(st.session_state.current_path[1:])
-                browser.items_cache.clear()
                 st.rerun()
     
     with col_main:
@@ -299,124 +892,33 @@ def main():
             # Current prefix
             if browser.current_prefix:
                 st.write(f"**📍 /{browser.current_prefix}**")
-            
+
+            # Targeted refresh: drops just this prefix, leaving the rest
+            # of the listing cache warm. The reload below happens in
+            # this same pass, so no explicit rerun
+            if st.button("🔄 Refresh", help="Re-read this folder from GCS"):
+                _invalidate_listing(browser, browser.current_bucket,
+                                    browser.current_prefix)
+
             # Load and display items
             with st.spinner("Loading..."):
-                items = browser.list_items(browser.current_bucket, browser.current_prefix)
-            
+                items = _cached_list_items(browser, browser.current_bucket, browser.current_prefix)
+
+            # Warm the cache for likely next clicks while the user reads
+            _prefetch_folders(browser, browser.current_bucket, items)
+            if st.session_state.get('settings', {}).get('auto_sizes', True):
+                _prefetch_folder_sizes(browser, items)
+
             if not items:
                 st.info("📭 No items found in this location")
             else:
-                # Items table with selection
-                st.subheader(f"📋 Items ({len(items)})")
-                
-                # Selection controls
-                col_select, col_download = st.columns([2, 1])
-                
-                with col_select:
-                    if st.button("Select All"):
-                        browser.selected_items = {item.path for item in items}
-                        st.rerun()
-                    
-                    if st.button("Clear Selection"):
-                        browser.selected_items.clear()
-                        st.rerun()
-                
-                with col_download:
-                    if browser.selected_items:
-                        st.write(f"🎯 {len(browser.selected_items)} selected")
-                    
-                    if st.button("⬇️ Download Selected", 
-                                disabled=not browser.selected_items,
-                                type="primary"):
-                        st.session_state.show_download_dialog = True
-                
-                # Items display
-                for item in items:
-                    col_check, col_icon, col_name, col_size, col_action = st.columns([1, 1, 4, 2, 2])
-                    
-                    with col_check:
-                        is_selected = item.path in browser.selected_items
-                        if st.checkbox("", value=is_selected, key=f"select_{item.path}"):
-                            browser.selected_items.add(item.path)
-                        else:
-                            browser.selected_items.discard(item.path)
-                    
-                    with col_icon:
-                        if item.type == "folder":
-                            st.write("📁")
-                        else:
-                            # File icon based on extension
-                            ext = Path(item.name).suffix.lower()
-                            if ext in ['.jpg', '.jpeg', '.png', '.gif', '.bmp']:
-                                st.write("🖼️")
-                            elif ext in ['.txt', '.md', '.csv']:
-                                st.write("📄")
-                            elif ext in ['.zip', '.tar', '.gz']:
-                                st.write("📦")
-                            else:
-                                st.write("📄")
-                    
-                    with col_name:
-                        st.write(f"**{item.name}**")
-                        if item.modified:
-                            # Handle both datetime objects and strings
-                            if hasattr(item.modified, 'strftime'):
-                                mod_str = item.modified.strftime('%Y-%m-%d %H:%M')
-                            else:
-                                mod_str = str(item.modified)
-                            st.caption(f"Modified: {mod_str}")
-                    
-                    with col_size:
-                        if item.type == "file":
-                            st.write(item.size_human)
-                        else:
-                            if st.button("📊", key=f"size_{item.path}", 
-                                        help="Calculate folder size"):
-                                with st.spinner("Calculating..."):
-                                    folder_size = browser.get_folder_size(
-                                        browser.current_bucket, 
-                                        item.path.replace(f"{browser.current_bucket}/", "")
-                                    )
-                                    if folder_size > 0:
-                                        size_item = GCSItem("", "", "folder", size=folder_size)
-                                        st.success(f"Size: {size_item.size_human}")
-                    
-                    with col_action:
-                        if item.type == "folder":
-                            if st.button("🔍", key=f"open_{item.path}", help="Open folder"):
-                                # Navigate into folder
-                                folder_name = item.name
-                                st.session_state.current_path.append(folder_name)
-                                if browser.current_prefix:
-                                    browser.current_prefix = f"{browser.current_prefix}/{folder_name}"
-                                else:
-                                    browser.current_prefix = folder_name
-                                browser.items_cache.clear()
-                                st.rerun()
-                        else:
-                            if st.button("⬇️", key=f"download_{item.path}", help="Download file"):
-                                # Quick download single file
-                                with st.spinner(f"Downloading {item.name}..."):
-                                    dest_folder = Path(destination_folder)
-                                    dest_folder.mkdir(parents=True, exist_ok=True)
-                                    
-                                    success = download_with_gcsfs(
-                                        browser, 
-                                        f"gs://{item.path}",
-                                        str(dest_folder)
-                                    )
-                                    
-                                    if success:
-                                        st.success(f"✅ Downloaded to {dest_folder}")
-                                    else:
-                                        st.error("❌ Download failed")
+                _render_items(browser, items, destination_folder, tools)
         
         # Download dialog
         if st.session_state.get('show_download_dialog', False):
             st.subheader("⬇️ Download Selected Items")
             
-            selected_paths = list(browser.selected_items)
+            selected_paths = list(_selection())
             
             col_dest, col_method = st.columns(2)
             
@@ -436,15 +938,18 @@ def main():
                     key="download_method_select"
                 )
             
-            # Estimate download size
-            total_size = 0
-            for path in selected_paths:
-                if not path.endswith('/'):  # File
-                    try:
-                        info = browser.fs.info(f"gs://{path}")
-                        total_size += info.get('size', 0)
-                    except:
-                        pass
+            # Estimate download size - one listing per parent prefix
+            # instead of a metadata call per selected file
+            # Fail the estimate once instead of retrying per path - a
+            # transient GCS error shouldn't multiply into N fsspec
+            # retry cycles or silently report 0 bytes
+            with st.spinner("Estimating size..."):
+                try:
+                    size_map = _batch_size_lookup(browser.fs, selected_paths)
+                    total_size = sum(size_map.values())
+                except Exception as e:
+                    st.warning(f"Size estimate unavailable: {e}")
+                    total_size = 0
             
             if total_size > 0:
                 size_item = GCSItem("", "", "", size=total_size)
@@ -455,36 +960,87 @@ def main():
             with col_start:
                 if st.button("🚀 Start Download", type="primary"):
                     # Start download process
-                    dest_path = Path(download_dest)
-                    dest_path.mkdir(parents=True, exist_ok=True)
-                    
+                    dest_path = Path(_ensure_dir(download_dest))
+
                     progress_bar = st.progress(0)
                     status_text = st.empty()
-                    
-                    for i, path in enumerate(selected_paths):
-                        status_text.text(f"Downloading {path}...")
-                        
-                        if method == "gsutil":
-                            success = download_with_gsutil(
+                    failures = []
+
+                    if method == "gsutil":
+                        # One gsutil invocation covering every selected
+                        # path: interpreter + auth-discovery startup
+                        # (~1-2s) is paid once instead of per item, and
+                        # -m balances its workers across all objects
+                        ok = download_with_gsutil(
+                            [f"gs://{path}" for path in selected_paths],
+                            str(dest_path),
+                            recursive=True,
+                            progress_callback=_StreamlitProgress(
+                                progress_bar, status_text)
+                        )
+                        if not ok:
+                            failures = list(selected_paths)
+                        progress_bar.progress(1.0)
+                    else:
+                        # Byte-level progress only makes sense serially;
+                        # parallel workers would interleave their updates
+                        serial_progress = (None if parallel_downloads
+                                           else _StreamlitProgress(progress_bar, status_text))
+
+                        def _download_one(path):
+                            if method == "gcloud":
+                                # Official batched client API - avoids
+                                # per-file connection setup
+                                return download_with_transfer_manager(
+                                    browser,
+                                    f"gs://{path}",
+                                    str(dest_path),
+                                    progress_callback=serial_progress
+                                )
+                            return download_with_gcsfs(
+                                browser,
                                 f"gs://{path}",
                                 str(dest_path),
-                                recursive=True
+                                progress_callback=serial_progress
                             )
+
+                        total = len(selected_paths)
+                        if parallel_downloads:
+                            # Run transfers concurrently so bandwidth isn't
+                            # idle between items
+                            with ThreadPoolExecutor(max_workers=10) as executor:
+                                futures = {executor.submit(_download_one, path): path
+                                           for path in selected_paths}
+                                for done, future in enumerate(as_completed(futures), start=1):
+                                    path = futures[future]
+                                    status_text.text(f"Downloaded {done}/{total} items")
+                                    progress_bar.progress(done / total)
+                                    try:
+                                        if not future.result():
+                                            failures.append(path)
+                                    except Exception:
+                                        failures.append(path)
                         else:
-                            success = download_with_gcsfs(
-                                browser,
-                                f"gs://{path}",
-                                str(dest_path)
-                            )
-                        
-                        progress_bar.progress((i + 1) / len(selected_paths))
-                        
-                        if not success:
-                            st.error(f"❌ Failed to download {path}")
-                    
+                            # Serial transfers stay on the script thread:
+                            # Streamlit drops widget calls made from
+                            # threads without a ScriptRunContext, so the
+                            # byte-level progress would never render from
+                            # an executor worker
+                            for done, path in enumerate(selected_paths, start=1):
+                                try:
+                                    if not _download_one(path):
+                                        failures.append(path)
+                                except Exception:
+                                    failures.append(path)
+                                status_text.text(f"Downloaded {done}/{total} items")
+                                progress_bar.progress(done / total)
+
+                    for path in failures:
+                        st.error(f"❌ Failed to download {path}")
+
                     status_text.text("✅ Download completed!")
                     st.session_state.show_download_dialog = False
-                    browser.selected_items.clear()
+                    _selection().clear()
             
             with col_cancel:
                 if st.button("❌ Cancel"):
@@ -494,26 +1050,17 @@ def main():
 
 def run_web_app():
     """Entry point for the gcs-browser-web command"""
-    import streamlit.web.cli as stcli
     import sys
-    import os
-    from pathlib import Path
-    
-    # Set up the path to this module
-    current_file = Path(__file__)
-    
+    from .launcher import run_streamlit
+
     print(f"🚀 Starting GCS Browser Web Interface...")
-    print(f"📱 Access at: http://localhost:8501")  
+    print(f"📱 Access at: http://localhost:8501")
     print(f"🛑 Press Ctrl+C to stop")
-    
+
     try:
-        # Use streamlit's CLI directly
-        sys.argv = [
-            "streamlit", "run", str(current_file),
-            "--server.address", "0.0.0.0",
-            "--server.port", "8501"
-        ]
-        stcli.main()
+        # bootstrap runs the server in this process, skipping the CLI
+        # argument parsing (and, on the fallback path, the extra fork)
+        run_streamlit(__file__, port=8501)
     except KeyboardInterrupt:
         print("\nShutting down...")
         sys.exit(0)
@@ -523,5 +1070,23 @@ def run_web_app():
         sys.exit(1)
 
 
+def _warm_imports():
+    """Pre-import the heavy GCS client stacks off the request path
+
+    connect() pulls in gcsfs and google-cloud-storage lazily, so the
+    first Connect click otherwise pays their import and descriptor
+    parsing (~1-2s). Warming them in a daemon thread while the user
+    reads the page makes the click hit a warm sys.modules.
+    """
+    try:
+        import gcsfs  # noqa: F401
+        from google.cloud import storage  # noqa: F401
+    except ImportError:
+        pass  # connect() will surface the real error to the user
+
+
+threading.Thread(target=_warm_imports, daemon=True).start()
+
+
 if __name__ == "__main__":
     main()
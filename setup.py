@@ -7,23 +7,22 @@ from pathlib import Path
 this_directory = Path(__file__).parent
 long_description = (this_directory / "README.md").read_text(encoding='utf-8')
 
-# Read requirements with flexible handling
-requirements = []
-requirements_file = this_directory / "requirements.txt"
-if requirements_file.exists():
-    with open(requirements_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                # Keep minimum version constraints for core functionality
-                # but make them more flexible
-                if '>=' in line:
-                    # Keep the minimum version requirement
-                    requirements.append(line)
-                else:
-                    # For lines without version, just add the package name
-                    package = line.split('>=')[0].split('==')[0].split('<')[0]
-                    requirements.append(package)
+# Static requirements: no file parsing at build time, and pip's
+# resolver sees the constraints exactly as written. Keep in sync with
+# requirements.txt (which stays for pip install -r workflows).
+requirements = [
+    "gcsfs>=2023.6.0",
+    "google-cloud-storage>=2.10.0",
+    "pandas>=1.3.0",
+    "numpy>=1.19.0",
+    "python-dateutil>=2.7.0",
+    "tqdm>=4.60.0",
+    "psutil>=5.8.0",
+    "requests>=2.25.0",
+    "charset-normalizer>=2.0.0",
+    "streamlit>=1.25.0",
+    "orjson>=3.6.0",
+]
 
 setup(
     name="optics-toolbox",
@@ -75,7 +74,7 @@ setup(
             "gcs-browser=gcs_browser.cli:main",
             "gcs-browser-web=gcs_browser.web:run_web_app",
             "gcs-browser-launcher=gcs_browser.launcher:main",
-            "gcs-browser-simple=gcs_browser.web_simple:run_simple_web_app",
+            "gcs-browser-simple=gcs_browser.web_fixed:run_simple_web_app",
         ],
     },
     include_package_data=True,
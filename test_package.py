@@ -3,6 +3,11 @@
 Test script to verify the gcs_browser package installation and functionality
 """
 
+import contextlib
+import io
+import sys
+
+
 def test_imports():
     """Test if the package can be imported"""
     print("🧪 Testing package imports...")
@@ -52,31 +57,54 @@ def test_tools():
 def test_gcs_connection():
     """Test basic GCS connection"""
     print("\n🌐 Testing GCS connection...")
-    
+
     try:
+        from concurrent.futures import ThreadPoolExecutor, TimeoutError
         from gcs_browser import GCSBrowser
-        
+
         browser = GCSBrowser()
-        success = browser.connect(use_anonymous=True)
-        
-        if success:
+
+        # Bounded waits: on a network partition the test fails in
+        # seconds instead of hanging CI until its global timeout. The
+        # two probes run sequentially because listing needs the
+        # connected filesystem.
+        pool = ThreadPoolExecutor(max_workers=1)
+        try:
+            try:
+                success = pool.submit(
+                    browser.connect, use_anonymous=True).result(timeout=10)
+            except TimeoutError:
+                print("   ❌ Connection timed out after 10s")
+                return False
+
+            if not success:
+                print("   ❌ Failed to connect to GCS")
+                return False
+
             print("   ✅ Successfully connected to GCS (anonymous)")
-            
+
             # Test listing a known public bucket
-            items = browser.list_items("nmfs_odp_pifsc", "")
-            if items:
-                print(f"   ✅ Found {len(items)} items in nmfs_odp_pifsc bucket")
-                print(f"      First few items:")
-                for item in items[:3]:
-                    print(f"        - {item.type}: {item.name}")
-            else:
-                print("   ⚠️  No items found (bucket might be empty or access restricted)")
-            
-            return True
+            try:
+                items = pool.submit(
+                    browser.list_items, "nmfs_odp_pifsc", "").result(timeout=15)
+            except TimeoutError:
+                print("   ❌ Bucket listing timed out after 15s")
+                return False
+        finally:
+            # Don't wait for a possibly hung worker; the sockets time
+            # out on their own
+            pool.shutdown(wait=False)
+
+        if items:
+            print(f"   ✅ Found {len(items)} items in nmfs_odp_pifsc bucket")
+            print(f"      First few items:")
+            for item in items[:3]:
+                print(f"        - {item.type}: {item.name}")
         else:
-            print("   ❌ Failed to connect to GCS")
-            return False
-            
+            print("   ⚠️  No items found (bucket might be empty or access restricted)")
+
+        return True
+
     except Exception as e:
         print(f"   ❌ GCS connection test failed: {e}")
         return False
@@ -85,28 +113,46 @@ def test_gcs_connection():
 def test_cli_entry_point():
     """Test CLI entry point"""
     print("\n🖥️  Testing CLI entry point...")
-    
+
     try:
-        import subprocess
-        import sys
-        
-        # Test if the CLI entry point exists
-        result = subprocess.run([sys.executable, '-m', 'gcs_browser.cli', '--help'], 
-                              capture_output=True, text=True)
-        
-        if result.returncode == 0:
+        from gcs_browser.cli import main as cli_main
+
+        # Direct invocation: no interpreter fork, no re-import of the
+        # heavy GCS stacks. --help exits via SystemExit(0)
+        buf = io.StringIO()
+        code = 0
+        with contextlib.redirect_stdout(buf):
+            try:
+                cli_main(['--help'])
+            except SystemExit as e:
+                code = e.code or 0
+
+        if code == 0 and 'usage' in buf.getvalue().lower():
             print("   ✅ CLI entry point working")
             return True
         else:
-            print(f"   ❌ CLI failed: {result.stderr}")
+            print(f"   ❌ CLI --help exited with code {code}")
             return False
-            
+
     except Exception as e:
         print(f"   ❌ CLI test failed: {e}")
         return False
 
 
 def main():
+    """Run all tests, emitting the report with one write"""
+    # Buffer the report and flush it once: a single write(2) instead of
+    # one per print, and the ordering stays intact under parallel
+    # runners
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buf):
+            return _run_tests()
+    finally:
+        sys.stdout.write(buf.getvalue())
+
+
+def _run_tests():
     """Run all tests"""
     print("🎯 GCS Browser Package Test")
     print("=" * 50)
@@ -147,5 +193,4 @@ def main():
 
 
 if __name__ == "__main__":
-    import sys
     sys.exit(main())
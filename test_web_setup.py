@@ -3,6 +3,8 @@
 Test script to verify the gcs-browser-web entry point works correctly
 """
 
+import contextlib
+import io
 import sys
 import subprocess
 from pathlib import Path
@@ -47,6 +49,18 @@ def test_entry_point():
         return False
 
 def main():
+    # Buffer the report and flush it once: a single write(2) instead of
+    # one per print, and the ordering stays intact under parallel
+    # runners
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buf):
+            _run_checks()
+    finally:
+        sys.stdout.write(buf.getvalue())
+
+
+def _run_checks():
     print("🧪 Testing optics-toolbox web interface setup...")
     print()
     
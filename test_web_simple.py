@@ -9,6 +9,22 @@ import sys
 import time
 import traceback
 
+
+@st.cache_resource
+def _probe_deps():
+    """One find_spec pass per process instead of an import block per
+    module per rerun"""
+    import importlib.util
+    status = {}
+    for mod in ("pandas", "gcsfs", "google.cloud.storage",
+                "gcs_browser.core"):
+        try:
+            status[mod] = importlib.util.find_spec(mod) is not None
+        except (ImportError, ValueError):
+            status[mod] = False
+    return status
+
+
 def main():
     """Minimal test web interface"""
     st.set_page_config(
@@ -23,38 +39,13 @@ def main():
     st.write(f"🐍 Python version: {sys.version}")
     st.write(f"⏰ Current time: {time.strftime('%Y-%m-%d %H:%M:%S')}")
     
-    # Test importing our modules
+    # Test importing our modules - one cached probe, one widget
     st.subheader("📦 Testing Imports")
-    
-    try:
-        import pandas as pd
-        st.success("✅ pandas imported successfully")
-        st.write(f"   Version: {pd.__version__}")
-    except Exception as e:
-        st.error(f"❌ pandas import failed: {e}")
-    
-    try:
-        import gcsfs
-        st.success("✅ gcsfs imported successfully")
-        st.write(f"   Version: {gcsfs.__version__}")
-    except Exception as e:
-        st.error(f"❌ gcsfs import failed: {e}")
-    
-    try:
-        from google.cloud import storage
-        st.success("✅ google-cloud-storage imported successfully")
-    except Exception as e:
-        st.error(f"❌ google-cloud-storage import failed: {e}")
-    
-    # Test our own modules
-    try:
-        from gcs_browser.core import GCSBrowser
-        st.success("✅ GCSBrowser imported successfully")
-    except Exception as e:
-        st.error(f"❌ GCSBrowser import failed: {e}")
-        st.text("Full error:")
-        st.code(traceback.format_exc())
-    
+
+    deps = _probe_deps()
+    st.markdown("  \n".join(
+        f"{'✅' if ok else '❌'} {mod}" for mod, ok in deps.items()))
+
     try:
         from gcs_browser.utils import detect_download_tools
         tools = detect_download_tools()
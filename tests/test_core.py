@@ -0,0 +1,327 @@
+"""Unit tests for GCSBrowser listing, caching and sizing logic.
+
+These run entirely against fakes - no network, no GCS credentials.
+"""
+
+import os
+import re
+import time
+from datetime import datetime
+
+import pytest
+
+from gcs_browser.core import GCSBrowser, GCSItem, size_human_batch
+
+
+class FakeFS:
+    """Stands in for gcsfs: canned ls() payload, call recording."""
+
+    def __init__(self, entries):
+        self.entries = entries
+        self.calls = []
+
+    def ls(self, path, detail=True):
+        self.calls.append(path)
+        return self.entries
+
+
+class FakeBlob:
+    def __init__(self, name, size=0, updated=None, etag=None):
+        self.name = name
+        self.size = size
+        self.updated = updated
+        self.etag = etag
+
+
+class FakeBlobIterator:
+    """Mimics the google-cloud-storage blob iterator.
+
+    Like the real one, prefixes and next_page_token are only populated
+    once a page has been consumed, and iterating an item whose name was
+    dropped from the partial response raises - the real client cannot
+    construct a blob without its name.
+    """
+
+    def __init__(self, blobs, prefixes=(), next_token=None):
+        self._blobs = blobs
+        self._prefixes = list(prefixes)
+        self._next_token = next_token
+        self.prefixes = []
+        self.next_page_token = None
+
+    def _iter_blobs(self):
+        for blob in self._blobs:
+            if blob.name is None:
+                raise ValueError("None could not be converted to unicode")
+            yield blob
+
+    def __iter__(self):
+        yield from self._iter_blobs()
+        self.prefixes = self._prefixes
+        self.next_page_token = self._next_token
+
+    @property
+    def pages(self):
+        def gen():
+            self.prefixes = self._prefixes
+            self.next_page_token = self._next_token
+            yield self._iter_blobs()
+        return gen()
+
+
+def _apply_fields(blobs, fields):
+    """Mimic a partial response: blank out attributes not requested."""
+    if not fields:
+        return blobs
+    match = re.search(r'items\(([^)]*)\)', fields)
+    if not match:
+        return blobs
+    requested = {field.strip() for field in match.group(1).split(',')}
+    return [
+        FakeBlob(name=blob.name if 'name' in requested else None,
+                 size=blob.size if 'size' in requested else None,
+                 updated=blob.updated if 'updated' in requested else None,
+                 etag=blob.etag if 'etag' in requested else None)
+        for blob in blobs
+    ]
+
+
+class FakeClient:
+    """Serves canned (blobs, prefixes, next_token) pages keyed by token."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+
+    def list_blobs(self, bucket=None, **kwargs):
+        self.calls.append(kwargs)
+        token = kwargs.get('page_token')
+        index = 0 if token is None else int(token)
+        blobs, prefixes, next_token = self.pages[index]
+        return FakeBlobIterator(_apply_fields(blobs, kwargs.get('fields')),
+                                prefixes, next_token)
+
+    def bucket(self, name):
+        return self
+
+
+def _browser(fs=None, client=None, cache_dir=None):
+    browser = GCSBrowser()
+    browser.fs = fs
+    browser.client = client
+    browser.cache_enabled = False
+    if cache_dir is not None:
+        browser.cache_enabled = True
+        browser._disk_cache_dir = cache_dir
+    return browser
+
+
+def test_list_raw_partitions_folders_and_files():
+    """_list_raw splits an fs.ls payload into folder and file rows."""
+    fs = FakeFS([
+        {'name': 'bkt/data/sub', 'type': 'directory'},
+        {'name': 'bkt/data/a.txt', 'type': 'file', 'size': 123,
+         'updated': '2023-12-01T12:34:56.789Z', 'etag': 'e1'},
+        # File in a subfolder should surface as a folder entry
+        {'name': 'bkt/data/deep/b.txt', 'type': 'file', 'size': 1},
+        # Entry outside the prefix must be filtered out
+        {'name': 'bkt/other/c.txt', 'type': 'file', 'size': 9},
+    ])
+    browser = _browser(fs=fs)
+
+    folders, file_rows = browser._list_raw('bkt', 'data')
+
+    assert folders == {
+        'sub': ('bkt/data/sub', None),
+        'deep': ('bkt/data/deep', None),
+    }
+    assert file_rows == [
+        ('a.txt', 'bkt/data/a.txt', 123, '2023-12-01T12:34:56.789Z', 'e1'),
+    ]
+
+
+def test_list_items_sorts_folders_first():
+    """list_items returns folders before files, each alphabetically."""
+    fs = FakeFS([
+        {'name': 'bkt/z.txt', 'type': 'file', 'size': 1},
+        {'name': 'bkt/beta', 'type': 'directory'},
+        {'name': 'bkt/a.txt', 'type': 'file', 'size': 2},
+        {'name': 'bkt/Alpha', 'type': 'directory'},
+    ])
+    browser = _browser(fs=fs)
+
+    items = browser.list_items('bkt')
+
+    assert [(i.type, i.name) for i in items] == [
+        ('folder', 'Alpha'), ('folder', 'beta'),
+        ('file', 'a.txt'), ('file', 'z.txt'),
+    ]
+
+
+def test_size_human_batch_matches_per_item():
+    """Vectorized formatting agrees with GCSItem.size_human per row."""
+    sizes = [0, 1, 512, 1023, 1024, 1536, 10**6, 10**9, 5 * 2**40]
+    expected = [GCSItem('', '', 'file', size=s).size_human for s in sizes]
+    assert size_human_batch(sizes) == expected
+
+
+def test_disk_cache_round_trip(tmp_path):
+    """Listings written to the disk cache read back equal."""
+    browser = _browser(cache_dir=tmp_path)
+    items = [
+        GCSItem(name='sub', path='bkt/data/sub', type='folder'),
+        GCSItem(name='a.txt', path='bkt/data/a.txt', type='file', size=123,
+                modified=datetime(2023, 12, 1, 12, 34, 56), etag='e1'),
+    ]
+
+    browser._disk_cache_set('bkt/data', items)
+    cached = browser._disk_cache_get('bkt/data')
+
+    assert cached == items
+
+
+def test_disk_cache_expires_after_ttl(tmp_path):
+    """Entries older than CACHE_TTL are treated as misses."""
+    browser = _browser(cache_dir=tmp_path)
+    browser._disk_cache_set('bkt/data', [
+        GCSItem(name='a.txt', path='bkt/a.txt', type='file', size=1)])
+
+    cache_file = browser._disk_cache_path('bkt/data')
+    stale = time.time() - (GCSBrowser.CACHE_TTL + 1)
+    os.utime(cache_file, (stale, stale))
+
+    assert browser._disk_cache_get('bkt/data') is None
+
+
+def test_invalidate_drops_both_cache_layers(tmp_path):
+    """invalidate() removes the memory entry and the disk entry."""
+    browser = _browser(cache_dir=tmp_path)
+    items = [GCSItem(name='a.txt', path='bkt/a.txt', type='file', size=1)]
+    browser.items_cache['bkt/data'] = items
+    browser._disk_cache_set('bkt/data', items)
+
+    browser.invalidate('bkt', 'data')
+
+    assert 'bkt/data' not in browser.items_cache
+    assert browser._disk_cache_get('bkt/data') is None
+    assert not browser._disk_cache_path('bkt/data').exists()
+
+
+def test_clear_disk_cache_removes_all_entries(tmp_path):
+    """clear_disk_cache() empties the on-disk cache directory."""
+    browser = _browser(cache_dir=tmp_path)
+    items = [GCSItem(name='a.txt', path='bkt/a.txt', type='file', size=1)]
+    browser._disk_cache_set('bkt/one', items)
+    browser._disk_cache_set('bkt/two', items)
+
+    browser.clear_disk_cache()
+
+    assert list(tmp_path.glob('*.json')) == []
+
+
+def test_list_items_max_results_is_capped_and_uncached():
+    """max_results goes server-side and the partial result is not cached."""
+    client = FakeClient([
+        ([FakeBlob('data/a.txt', size=3, etag='e1')], ['data/sub/'], None),
+    ])
+    browser = _browser(fs=FakeFS([]), client=client)
+
+    items = browser.list_items('bkt', 'data', max_results=5)
+
+    call = client.calls[0]
+    assert call['prefix'] == 'data/'
+    assert call['delimiter'] == '/'
+    assert call['max_results'] == 5
+    assert [(i.type, i.name) for i in items] == [
+        ('folder', 'sub'), ('file', 'a.txt')]
+    assert browser.items_cache == {}
+
+
+def test_list_items_page_returns_token():
+    """list_items_page yields one page plus the continuation token."""
+    client = FakeClient([
+        ([FakeBlob('data/a.txt', size=1)], ['data/sub/'], '1'),
+        ([FakeBlob('data/b.txt', size=2)], [], None),
+    ])
+    browser = _browser(fs=FakeFS([]), client=client)
+
+    items, token = browser.list_items_page('bkt', 'data')
+    assert [(i.type, i.name) for i in items] == [
+        ('folder', 'sub'), ('file', 'a.txt')]
+    assert token == '1'
+
+    items, token = browser.list_items_page('bkt', 'data', page_token=token)
+    assert [(i.type, i.name) for i in items] == [('file', 'b.txt')]
+    assert token is None
+
+
+def test_list_items_pages_walks_every_page():
+    """list_items_pages iterates until the token runs out."""
+    client = FakeClient([
+        ([FakeBlob('a.txt', size=1)], [], '1'),
+        ([FakeBlob('b.txt', size=2)], [], None),
+    ])
+    browser = _browser(fs=FakeFS([]), client=client)
+
+    pages = list(browser.list_items_pages('bkt'))
+
+    assert len(pages) == 2
+    assert [i.name for items, _ in pages for i in items] == ['a.txt', 'b.txt']
+    assert pages[-1][1] is None
+
+
+def test_list_items_parallel_warms_child_folders():
+    """list_items_parallel lists each child prefix of the top level."""
+    calls = []
+
+    class RecordingBrowser(GCSBrowser):
+        def list_items(self, bucket, prefix="", max_results=None):
+            calls.append(prefix)
+            if prefix == "":
+                return [
+                    GCSItem(name='a', path='bkt/a', type='folder'),
+                    GCSItem(name='b', path='bkt/b', type='folder'),
+                    GCSItem(name='x.txt', path='bkt/x.txt', type='file'),
+                ]
+            return []
+
+    browser = RecordingBrowser()
+    items = browser.list_items_parallel('bkt')
+
+    assert [i.name for i in items] == ['a', 'b', 'x.txt']
+    assert sorted(calls) == ['', 'a', 'b']
+
+
+def test_get_folder_size_anchors_prefix_to_folder_boundary():
+    """get_folder_size queries 'data/' so siblings like data2/ don't count."""
+    client = FakeClient([
+        ([FakeBlob('data/a.txt', size=10), FakeBlob('data/b.txt', size=5)],
+         [], None),
+    ])
+    browser = _browser(fs=FakeFS([]), client=client)
+
+    total = browser.get_folder_size('bkt', 'data')
+
+    assert total == 15
+    assert client.calls[0]['prefix'] == 'data/'
+
+
+def test_list_items_df_matches_listing():
+    """list_items_df returns the same rows as list_items, folders first."""
+    pd = pytest.importorskip('pandas')
+
+    fs = FakeFS([
+        {'name': 'bkt/sub', 'type': 'directory'},
+        {'name': 'bkt/a.txt', 'type': 'file', 'size': 7,
+         'updated': '2023-12-01T12:34:56.789Z', 'etag': 'e1'},
+    ])
+    browser = _browser(fs=fs)
+
+    df = browser.list_items_df('bkt')
+
+    assert list(df.columns) == ['name', 'path', 'type', 'size',
+                                'modified', 'etag']
+    assert df['name'].tolist() == ['sub', 'a.txt']
+    assert df['type'].tolist() == ['folder', 'file']
+    assert df['size'].tolist() == [0, 7]
+    assert pd.notna(df['modified'].iloc[1])
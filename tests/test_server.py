@@ -0,0 +1,68 @@
+"""Tests for the command server's socket handling and wire protocol."""
+
+import os
+import stat
+import threading
+import time
+
+import pytest
+
+from gcs_browser import server
+from gcs_browser.core import GCSBrowser, GCSItem
+
+
+def test_socket_path_prefers_runtime_dir(monkeypatch, tmp_path):
+    """With XDG_RUNTIME_DIR set, the socket lives there under a plain name."""
+    monkeypatch.setenv('XDG_RUNTIME_DIR', str(tmp_path))
+    assert server.socket_path() == tmp_path / 'gcs_browser.sock'
+
+
+def test_socket_path_is_per_user_in_tempdir(monkeypatch):
+    """Without XDG_RUNTIME_DIR the fallback name carries the uid."""
+    monkeypatch.delenv('XDG_RUNTIME_DIR', raising=False)
+    assert server.socket_path().name == f'gcs_browser-{os.getuid()}.sock'
+
+
+def test_send_request_returns_none_without_server(monkeypatch, tmp_path):
+    """No socket file means None, so callers fall back in-process."""
+    monkeypatch.setenv('XDG_RUNTIME_DIR', str(tmp_path))
+    assert server.send_request({'cmd': 'ping'}) is None
+
+
+def test_serve_round_trip(monkeypatch, tmp_path):
+    """serve answers ping/list over its socket and honors stop."""
+    monkeypatch.setenv('XDG_RUNTIME_DIR', str(tmp_path))
+    monkeypatch.setattr(GCSBrowser, 'connect',
+                        lambda self, **kwargs: True)
+    monkeypatch.setattr(
+        GCSBrowser, 'list_items',
+        lambda self, bucket, prefix="", max_results=None: [
+            GCSItem(name='a.txt', path=f'{bucket}/a.txt', type='file',
+                    size=3)])
+
+    thread = threading.Thread(target=server.serve, daemon=True)
+    thread.start()
+    try:
+        deadline = time.time() + 5
+        while time.time() < deadline:
+            if server.send_request({'cmd': 'ping'}, timeout=1) == {'status': 'ok'}:
+                break
+            time.sleep(0.05)
+        else:
+            pytest.fail("server did not come up within 5s")
+
+        # Owner-only: other local users must not be able to query a
+        # credentialed daemon
+        mode = stat.S_IMODE(os.stat(server.socket_path()).st_mode)
+        assert mode == 0o600
+
+        items = server.list_items_via_server('bkt')
+        assert [(i.name, i.size) for i in items] == [('a.txt', 3)]
+
+        assert server.send_request({'cmd': 'stop'}) == {'status': 'ok'}
+    finally:
+        server.send_request({'cmd': 'stop'})
+        thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert not server.socket_path().exists()